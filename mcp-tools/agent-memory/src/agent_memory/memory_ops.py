@@ -29,6 +29,9 @@ DEFAULT_ALLOWED_SECTIONS = [
     "Next Actions"
 ]
 
+# Modes accepted by update_summary
+SUMMARY_UPDATE_MODES = frozenset({"append", "replace"})
+
 # Default schema content
 DEFAULT_SCHEMA_CONTENT = """# Agent Memory Schema v1
 
@@ -294,7 +297,7 @@ class MemoryManager:
         Returns:
             Success result with details
         """
-        if mode not in ["append", "replace"]:
+        if mode not in SUMMARY_UPDATE_MODES:
             raise ValueError(f"Invalid mode '{mode}'. Must be 'append' or 'replace'")
 
         sanitized_content = sanitize_content(content)
@@ -38,6 +38,12 @@ logger = logging.getLogger(__name__)
 # Create MCP server instance
 server = Server("agent-memory")
 
+# TOOL_METADATA is fixed at import, so the unknown-tool hint is built once
+_UNKNOWN_TOOL_HINT = f"Available tools: {', '.join(TOOL_METADATA)}"
+
+# json.dumps builds a fresh encoder whenever options are passed; reuse one
+_RESPONSE_ENCODER = json.JSONEncoder(indent=2, default=str)
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List all available agent memory tools."""
@@ -66,9 +72,11 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     if not isinstance(arguments, dict):
         arguments = {}
 
-    logger.info(
-        "Tool called: %s args=%s", name, json.dumps(arguments, default=str)
-    )
+    # Only argument names at INFO; the full payload is JSON-encoded only
+    # when DEBUG logging is actually enabled.
+    logger.info("Tool called: %s args=%s", name, list(arguments))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Tool %s args-json=%s", name, json.dumps(arguments, default=str))
 
     try:
         # Dispatch to tool implementations
@@ -87,7 +95,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
                 "ok": False,
                 "code": "UserInput",
                 "message": f"Unknown tool: {name}",
-                "hint": f"Available tools: {', '.join(TOOL_METADATA.keys())}"
+                "hint": _UNKNOWN_TOOL_HINT
             }
 
         # Defensive normalization: if a tool accidentally returns a plain list or scalar
@@ -103,7 +111,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         )
 
         # Always serialize tool result as JSON string inside TextContent
-        content = TextContent(type="text", text=json.dumps(raw_result, indent=2, default=str))
+        content = TextContent(type="text", text=_RESPONSE_ENCODER.encode(raw_result))
         return [content]
 
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -114,7 +122,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             "message": "Tool execution failed",
             "detail": str(e)
         }
-        content = TextContent(type="text", text=json.dumps(error_result, indent=2, default=str))
+        content = TextContent(type="text", text=_RESPONSE_ENCODER.encode(error_result))
         return [content]
 
 
@@ -143,120 +151,134 @@ async def list_resources() -> list[Resource]:
     return resources
 
 
+# Resource payloads never change at runtime; serialize them once at import.
+_SCHEMA_INFO_JSON = json.dumps(
+    {
+        "schema_version": SCHEMA_VERSION,
+        "allowed_sections": DEFAULT_ALLOWED_SECTIONS,
+        "repository_structure": {
+            "root": ".github/agent-memory/<agent-name>/",
+            "logs": "logs/YYYY-MM-DD.md",
+            "schema": "_schema.md",
+            "summary": "_summary.md"
+        },
+        "section_descriptions": {
+            "Context": "Project context, focus area, and current stage",
+            "Discussion Summary": "Key topics discussed during the session",
+            "Decisions": "Explicit decisions made during the session",
+            "Open Questions": "Unresolved issues, risks, or uncertainties",
+            "Next Actions": "Follow-up actions and next steps"
+        },
+        "design_principles": [
+            "Deterministic - No probabilistic behavior",
+            "Schema-enforced - All memory follows declared structure",
+            "Repo-local - Memory lives inside the consuming Git repository",
+            "Agent-safe - Agents read freely, write via explicit tools only",
+            "Human-controlled - Humans decide what becomes durable knowledge"
+        ]
+    },
+    indent=2,
+)
+
+_STATUS_JSON = json.dumps(
+    {
+        "server_name": "Agent Memory MCP Server",
+        "version": "1.0.0",
+        "schema_version": SCHEMA_VERSION,
+        "tools_available": len(TOOL_METADATA),
+        "tool_names": list(TOOL_METADATA.keys()),
+        "capabilities": [
+            "Session management",
+            "Structured memory logging",
+            "Persistent summaries",
+            "Schema validation",
+            "Repository-scoped storage"
+        ],
+        "safety_features": [
+            "Path traversal protection",
+            "Repository boundary enforcement",
+            "Agent name validation",
+            "Content sanitization",
+            "Schema compliance checking"
+        ],
+        "limitations": [
+            "No delete operations supported",
+            "No network access required",
+            "No arbitrary shell execution",
+            "Memory limited to repository scope"
+        ]
+    },
+    indent=2,
+)
+
+_EXAMPLES_JSON = json.dumps(
+    {
+        "typical_workflow": [
+            "1. Agent session starts",
+            "2. Agent reads summary via read_summary",
+            "3. Human and agent reason together",
+            "4. Important outcomes persisted via append_entry",
+            "5. Durable knowledge curated into summary via update_summary"
+        ],
+        "start_session_example": {
+            "tool": "start_session",
+            "arguments": {
+                "agent_name": "aristotle",
+                "repo_root": "/path/to/project"
+            }
+        },
+        "append_entry_example": {
+            "tool": "append_entry",
+            "arguments": {
+                "agent_name": "aristotle",
+                "repo_root": "/path/to/project",
+                "section": "Decisions",
+                "content": "Decided to use React for the frontend framework"
+            }
+        },
+        "read_summary_example": {
+            "tool": "read_summary",
+            "arguments": {
+                "agent_name": "aristotle",
+                "repo_root": "/path/to/project"
+            }
+        },
+        "update_summary_example": {
+            "tool": "update_summary",
+            "arguments": {
+                "agent_name": "aristotle",
+                "repo_root": "/path/to/project",
+                "section": "Key Knowledge",
+                "content": "Frontend architecture: React with TypeScript, using Vite for build tooling",
+                "mode": "append"
+            }
+        },
+        "list_sessions_example": {
+            "tool": "list_sessions",
+            "arguments": {
+                "agent_name": "aristotle",
+                "repo_root": "/path/to/project",
+                "limit": 10
+            }
+        }
+    },
+    indent=2,
+)
+
+
 @server.read_resource()
 async def read_resource(uri: str) -> str:
     """Read resource content."""
     logger.info("Resource requested: %s", uri)
 
     if uri == "memory://schema-info":
-        schema_info = {
-            "schema_version": SCHEMA_VERSION,
-            "allowed_sections": DEFAULT_ALLOWED_SECTIONS,
-            "repository_structure": {
-                "root": ".github/agent-memory/<agent-name>/",
-                "logs": "logs/YYYY-MM-DD.md",
-                "schema": "_schema.md",
-                "summary": "_summary.md"
-            },
-            "section_descriptions": {
-                "Context": "Project context, focus area, and current stage",
-                "Discussion Summary": "Key topics discussed during the session",
-                "Decisions": "Explicit decisions made during the session",
-                "Open Questions": "Unresolved issues, risks, or uncertainties",
-                "Next Actions": "Follow-up actions and next steps"
-            },
-            "design_principles": [
-                "Deterministic - No probabilistic behavior",
-                "Schema-enforced - All memory follows declared structure",
-                "Repo-local - Memory lives inside the consuming Git repository",
-                "Agent-safe - Agents read freely, write via explicit tools only",
-                "Human-controlled - Humans decide what becomes durable knowledge"
-            ]
-        }
-        return json.dumps(schema_info, indent=2)
+        return _SCHEMA_INFO_JSON
 
     elif uri == "memory://server-status":
-        status = {
-            "server_name": "Agent Memory MCP Server",
-            "version": "1.0.0",
-            "schema_version": SCHEMA_VERSION,
-            "tools_available": len(TOOL_METADATA),
-            "tool_names": list(TOOL_METADATA.keys()),
-            "capabilities": [
-                "Session management",
-                "Structured memory logging",
-                "Persistent summaries",
-                "Schema validation",
-                "Repository-scoped storage"
-            ],
-            "safety_features": [
-                "Path traversal protection",
-                "Repository boundary enforcement",
-                "Agent name validation",
-                "Content sanitization",
-                "Schema compliance checking"
-            ],
-            "limitations": [
-                "No delete operations supported",
-                "No network access required",
-                "No arbitrary shell execution",
-                "Memory limited to repository scope"
-            ]
-        }
-        return json.dumps(status, indent=2)
+        return _STATUS_JSON
 
     elif uri == "memory://usage-examples":
-        examples = {
-            "typical_workflow": [
-                "1. Agent session starts",
-                "2. Agent reads summary via read_summary",
-                "3. Human and agent reason together",
-                "4. Important outcomes persisted via append_entry",
-                "5. Durable knowledge curated into summary via update_summary"
-            ],
-            "start_session_example": {
-                "tool": "start_session",
-                "arguments": {
-                    "agent_name": "aristotle",
-                    "repo_root": "/path/to/project"
-                }
-            },
-            "append_entry_example": {
-                "tool": "append_entry",
-                "arguments": {
-                    "agent_name": "aristotle",
-                    "repo_root": "/path/to/project",
-                    "section": "Decisions",
-                    "content": "Decided to use React for the frontend framework"
-                }
-            },
-            "read_summary_example": {
-                "tool": "read_summary",
-                "arguments": {
-                    "agent_name": "aristotle",
-                    "repo_root": "/path/to/project"
-                }
-            },
-            "update_summary_example": {
-                "tool": "update_summary",
-                "arguments": {
-                    "agent_name": "aristotle",
-                    "repo_root": "/path/to/project",
-                    "section": "Key Knowledge",
-                    "content": "Frontend architecture: React with TypeScript, using Vite for build tooling",
-                    "mode": "append"
-                }
-            },
-            "list_sessions_example": {
-                "tool": "list_sessions",
-                "arguments": {
-                    "agent_name": "aristotle",
-                    "repo_root": "/path/to/project",
-                    "limit": 10
-                }
-            }
-        }
-        return json.dumps(examples, indent=2)
+        return _EXAMPLES_JSON
 
     else:
         raise ValueError(f"Unknown resource URI: {uri}")
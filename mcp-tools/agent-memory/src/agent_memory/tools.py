@@ -16,7 +16,7 @@ from .errors import (
     timeout_error,
     user_input_error,
 )
-from .memory_ops import MemoryManager
+from .memory_ops import SUMMARY_UPDATE_MODES, MemoryManager
 from .safety import (
     InvalidRepositoryError,
     MemorySafetyError,
@@ -235,7 +235,7 @@ def validate_update_summary_params(params: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError("Parameter 'content' is required and must be a string")
 
     mode = params.get("mode")
-    if not mode or mode not in ["append", "replace"]:
+    if not isinstance(mode, str) or mode not in SUMMARY_UPDATE_MODES:
         raise ValueError("Parameter 'mode' is required and must be 'append' or 'replace'")
 
     return {
@@ -273,6 +273,25 @@ async def run_with_timeout(
         return timeout_error(f"Operation exceeded {timeout_seconds:.1f}s limit")
 
 
+async def _run_memory_operation(
+    validated: Dict[str, Any], operation: Callable[[MemoryManager], Any]
+) -> Dict[str, Any]:
+    """Run ``operation`` on the agent's MemoryManager with timeout protection.
+
+    Returns an error envelope from ``run_with_timeout`` unchanged and wraps
+    anything else in a success envelope.
+    """
+    async def run():
+        return operation(MemoryManager(validated["repo_root"], validated["agent_name"]))
+
+    result = await run_with_timeout(run, timeout_seconds=10.0)
+
+    if isinstance(result, dict) and not result.get("ok", True):
+        return result  # Already an error response
+
+    return {"ok": True, "data": result}
+
+
 async def tool_start_session(params: Dict[str, Any]) -> Dict[str, Any]:
     """Tool: Create or open a session log for an agent on a given date."""
     try:
@@ -281,16 +300,9 @@ async def tool_start_session(params: Dict[str, Any]) -> Dict[str, Any]:
         return user_input_error(str(e), hint="Check parameter types and values")
 
     try:
-        async def start_operation():
-            manager = MemoryManager(validated["repo_root"], validated["agent_name"])
-            return manager.start_session(validated["date"])
-
-        result = await run_with_timeout(start_operation, timeout_seconds=10.0)
-
-        if isinstance(result, dict) and not result.get("ok", True):
-            return result  # Already an error response
-
-        return {"ok": True, "data": result}
+        return await _run_memory_operation(
+            validated, lambda manager: manager.start_session(validated["date"])
+        )
 
     except MemorySafetyError as e:
         if isinstance(e, PathTraversalError):
@@ -313,20 +325,12 @@ async def tool_append_entry(params: Dict[str, Any]) -> Dict[str, Any]:
         return user_input_error(str(e), hint="Check parameter types and values")
 
     try:
-        async def append_operation():
-            manager = MemoryManager(validated["repo_root"], validated["agent_name"])
-            return manager.append_entry(
-                validated["section"],
-                validated["content"],
-                validated["date"]
-            )
-
-        result = await run_with_timeout(append_operation, timeout_seconds=10.0)
-
-        if isinstance(result, dict) and not result.get("ok", True):
-            return result  # Already an error response
-
-        return {"ok": True, "data": result}
+        return await _run_memory_operation(
+            validated,
+            lambda manager: manager.append_entry(
+                validated["section"], validated["content"], validated["date"]
+            ),
+        )
 
     except MemorySafetyError as e:
         if isinstance(e, PathTraversalError):
@@ -353,16 +357,9 @@ async def tool_read_summary(params: Dict[str, Any]) -> Dict[str, Any]:
         return user_input_error(str(e), hint="Provide valid agent_name and repo_root")
 
     try:
-        async def read_operation():
-            manager = MemoryManager(validated["repo_root"], validated["agent_name"])
-            return manager.read_summary()
-
-        result = await run_with_timeout(read_operation, timeout_seconds=10.0)
-
-        if isinstance(result, dict) and not result.get("ok", True):
-            return result  # Already an error response
-
-        return {"ok": True, "data": result}
+        return await _run_memory_operation(
+            validated, lambda manager: manager.read_summary()
+        )
 
     except MemorySafetyError as e:
         if isinstance(e, PathTraversalError):
@@ -385,20 +382,12 @@ async def tool_update_summary(params: Dict[str, Any]) -> Dict[str, Any]:
         return user_input_error(str(e), hint="Check parameter types and values")
 
     try:
-        async def update_operation():
-            manager = MemoryManager(validated["repo_root"], validated["agent_name"])
-            return manager.update_summary(
-                validated["section"],
-                validated["content"],
-                validated["mode"]
-            )
-
-        result = await run_with_timeout(update_operation, timeout_seconds=10.0)
-
-        if isinstance(result, dict) and not result.get("ok", True):
-            return result  # Already an error response
-
-        return {"ok": True, "data": result}
+        return await _run_memory_operation(
+            validated,
+            lambda manager: manager.update_summary(
+                validated["section"], validated["content"], validated["mode"]
+            ),
+        )
 
     except MemorySafetyError as e:
         if isinstance(e, PathTraversalError):
@@ -423,16 +412,9 @@ async def tool_list_sessions(params: Dict[str, Any]) -> Dict[str, Any]:
         return user_input_error(str(e), hint="Check parameter types and ranges")
 
     try:
-        async def list_operation():
-            manager = MemoryManager(validated["repo_root"], validated["agent_name"])
-            return manager.list_sessions(validated["limit"])
-
-        result = await run_with_timeout(list_operation, timeout_seconds=10.0)
-
-        if isinstance(result, dict) and not result.get("ok", True):
-            return result  # Already an error response
-
-        return {"ok": True, "data": result}
+        return await _run_memory_operation(
+            validated, lambda manager: manager.list_sessions(validated["limit"])
+        )
 
     except MemorySafetyError as e:
         if isinstance(e, PathTraversalError):
@@ -23,6 +23,13 @@ def test_errors_helpers_cover_branches():
     assert internal["correlation_id"] == "c"
     assert len(internal.get("detail", "")) == 200
 
+def test_generated_correlation_ids_refill_pool():
+    errors._ID_POOL.__dict__.clear()
+    ids = [errors.user_input_error("m")["correlation_id"] for _ in range(errors._ID_POOL_SIZE // errors._ID_BYTES + 2)]
+    assert all(len(i) == 2 * errors._ID_BYTES and int(i, 16) >= 0 for i in ids)
+    assert len(set(ids)) > len(ids) // 2
+    assert errors._ID_POOL.pos == 2 * errors._ID_BYTES
+
 
 def test_safety_validate_repository_root_path_traversal(monkeypatch, tmp_path):
     # Force resolve() to be a no-op so ".." and "~" survive into the string check.
@@ -49,6 +49,9 @@ def test_validate_param_helpers_error_branches(tmp_path):
     with pytest.raises(ValueError):
         tools.validate_update_summary_params({"agent_name": "a", "repo_root": root, "section": "s", "content": "x", "mode": "nope"})
 
+    with pytest.raises(ValueError):
+        tools.validate_update_summary_params({"agent_name": "a", "repo_root": root, "section": "s", "content": "x", "mode": ["append"]})
+
     with pytest.raises(ValueError):
         tools.validate_list_sessions_params({"agent_name": "a", "repo_root": root, "limit": 0})
 
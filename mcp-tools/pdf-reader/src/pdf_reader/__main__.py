@@ -10,8 +10,6 @@ import argparse
 import asyncio
 import sys
 
-from pdf_reader.server import run_server, test_server
-
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     """Parse command-line arguments."""
@@ -27,6 +25,10 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
 def main():
     """CLI dispatcher for PDF Reader MCP Server."""
     args = parse_args(sys.argv[1:])
+    # Imported after parsing so --help and bad arguments skip loading the
+    # MCP SDK and the PDF libraries.
+    from pdf_reader.server import run_server, test_server
+
     try:
         if args.test:
             # Run lightweight self-test (does NOT start persistent server loop)
@@ -5,15 +5,32 @@ all PDF processing operations.
 """
 
 import logging
-import uuid
+import os
+import threading
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Per-thread buffer of random bytes so error ids don't cost a urandom call each
+_ID_POOL = threading.local()
+_ID_POOL_SIZE = 512
+_ID_BYTES = 4
+
+
+def _new_id() -> str:
+    """Return a short random hex correlation id drawn from the thread's pool."""
+    buf = getattr(_ID_POOL, "buf", None)
+    pos = getattr(_ID_POOL, "pos", 0)
+    if buf is None or pos + _ID_BYTES > len(buf):
+        buf = _ID_POOL.buf = os.urandom(_ID_POOL_SIZE)
+        pos = 0
+    _ID_POOL.pos = pos + _ID_BYTES
+    return buf[pos:pos + _ID_BYTES].hex()
+
 
 def user_input_error(message: str, hint: Optional[str] = None, correlation_id: Optional[str] = None) -> Dict[str, Any]:
     """Return structured UserInput error."""
-    error_id = correlation_id or uuid.uuid4().hex[:8]
+    error_id = correlation_id or _new_id()
     logger.info("UserInput error [%s]: %s", error_id, message)
 
     error = {
@@ -31,7 +48,7 @@ def user_input_error(message: str, hint: Optional[str] = None, correlation_id: O
 
 def forbidden_error(message: str, correlation_id: Optional[str] = None) -> Dict[str, Any]:
     """Return structured Forbidden error."""
-    error_id = correlation_id or uuid.uuid4().hex[:8]
+    error_id = correlation_id or _new_id()
     logger.warning("Forbidden error [%s]: %s", error_id, message)
 
     return {
@@ -44,7 +61,7 @@ def forbidden_error(message: str, correlation_id: Optional[str] = None) -> Dict[
 
 def not_found_error(message: str, correlation_id: Optional[str] = None) -> Dict[str, Any]:
     """Return structured NotFound error."""
-    error_id = correlation_id or uuid.uuid4().hex[:8]
+    error_id = correlation_id or _new_id()
     logger.info("NotFound error [%s]: %s", error_id, message)
 
     return {
@@ -57,7 +74,7 @@ def not_found_error(message: str, correlation_id: Optional[str] = None) -> Dict[
 
 def timeout_error(message: str, correlation_id: Optional[str] = None) -> Dict[str, Any]:
     """Return structured Timeout error."""
-    error_id = correlation_id or uuid.uuid4().hex[:8]
+    error_id = correlation_id or _new_id()
     logger.warning("Timeout error [%s]: %s", error_id, message)
 
     return {
@@ -70,7 +87,7 @@ def timeout_error(message: str, correlation_id: Optional[str] = None) -> Dict[st
 
 def internal_error(message: str, detail: Optional[str] = None, correlation_id: Optional[str] = None) -> Dict[str, Any]:
     """Return structured Internal error."""
-    error_id = correlation_id or uuid.uuid4().hex[:8]
+    error_id = correlation_id or _new_id()
     logger.error("Internal error [%s]: %s - %s", error_id, message, detail)
 
     error = {
@@ -89,7 +106,7 @@ def internal_error(message: str, detail: Optional[str] = None, correlation_id: O
 
 def cancellation_error(message: str, correlation_id: Optional[str] = None) -> Dict[str, Any]:
     """Return structured Cancelled error."""
-    error_id = correlation_id or uuid.uuid4().hex[:8]
+    error_id = correlation_id or _new_id()
     logger.info("Cancellation [%s]: %s", error_id, message)
 
     return {
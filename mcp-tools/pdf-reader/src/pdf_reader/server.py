@@ -36,6 +36,12 @@ logger = logging.getLogger(__name__)
 # Create MCP server instance
 server = Server("pdf-reader")
 
+# TOOL_METADATA is fixed at import, so the unknown-tool hint is built once
+_UNKNOWN_TOOL_HINT = f"Available tools: {', '.join(TOOL_METADATA)}"
+
+# json.dumps builds a fresh encoder whenever options are passed; reuse one
+_RESPONSE_ENCODER = json.JSONEncoder(indent=2, default=str)
+
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
@@ -65,9 +71,11 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     if not isinstance(arguments, dict):
         arguments = {}
 
-    logger.info(
-        "Tool called: %s args=%s", name, json.dumps(arguments, default=str)
-    )
+    # Only argument names at INFO; the full payload is JSON-encoded only
+    # when DEBUG logging is actually enabled.
+    logger.info("Tool called: %s args=%s", name, list(arguments))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Tool %s args-json=%s", name, json.dumps(arguments, default=str))
 
     try:
         # Dispatch to tool implementations
@@ -90,7 +98,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
                 "ok": False,
                 "code": "UserInput",
                 "message": f"Unknown tool: {name}",
-                "hint": f"Available tools: {', '.join(TOOL_METADATA.keys())}"
+                "hint": _UNKNOWN_TOOL_HINT
             }
 
         # Defensive normalization: if a tool accidentally returns a plain list or scalar
@@ -106,7 +114,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         )
 
         # Always serialize tool result as JSON string inside TextContent
-        content = TextContent(type="text", text=json.dumps(raw_result, indent=2, default=str))
+        content = TextContent(type="text", text=_RESPONSE_ENCODER.encode(raw_result))
         return [content]
 
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -117,7 +125,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             "message": "Tool execution failed",
             "detail": str(e)
         }
-        content = TextContent(type="text", text=json.dumps(error_result, indent=2, default=str))
+        content = TextContent(type="text", text=_RESPONSE_ENCODER.encode(error_result))
         return [content]
 
 
@@ -141,52 +149,62 @@ async def list_resources() -> list[Resource]:
     return resources
 
 
+# Resource payloads never change at runtime; serialize them once at import.
+_FEATURES_JSON = json.dumps(
+    {
+        "text_extraction": True,
+        "image_extraction": True,
+        "table_extraction": True,
+        "metadata_extraction": True,
+        "ocr_support": False,
+        "streaming_support": True,
+        "supported_formats": [".pdf"],
+        "max_file_size_mb": 100,
+        "dependencies": {
+            "pypdf": "Basic PDF reading",
+            "pdfplumber": "Advanced text and table extraction",
+            "Pillow": "Image processing",
+            "pandas": "Table data processing"
+        },
+        "limitations": [
+            "Password-protected PDFs not supported",
+            "Very large files (>100MB) may timeout",
+            "OCR functionality not available",
+            "Complex table layouts may not extract perfectly"
+        ]
+    },
+    indent=2,
+)
+
+_STATUS_JSON = json.dumps(
+    {
+        "server_name": "PDF Reader MCP Server",
+        "version": "1.0.0",
+        "tools_available": len(TOOL_METADATA),
+        "tool_names": list(TOOL_METADATA.keys()),
+        "ocr_available": False,
+        "max_file_size_mb": 100,
+        "safety_features": [
+            "File size limits",
+            "Path traversal protection",
+            "File type validation",
+            "Timeout protection"
+        ]
+    },
+    indent=2,
+)
+
+
 @server.read_resource()
 async def read_resource(uri: str) -> str:
     """Read resource content."""
     logger.info("Resource requested: %s", uri)
 
     if uri == "pdf://supported-features":
-        features = {
-            "text_extraction": True,
-            "image_extraction": True,
-            "table_extraction": True,
-            "metadata_extraction": True,
-            "ocr_support": False,
-            "streaming_support": True,
-            "supported_formats": [".pdf"],
-            "max_file_size_mb": 100,
-            "dependencies": {
-                "pypdf": "Basic PDF reading",
-                "pdfplumber": "Advanced text and table extraction",
-                "Pillow": "Image processing",
-                "pandas": "Table data processing"
-            },
-            "limitations": [
-                "Password-protected PDFs not supported",
-                "Very large files (>100MB) may timeout",
-                "OCR functionality not available",
-                "Complex table layouts may not extract perfectly"
-            ]
-        }
-        return json.dumps(features, indent=2)
+        return _FEATURES_JSON
 
     elif uri == "pdf://server-status":
-        status = {
-            "server_name": "PDF Reader MCP Server",
-            "version": "1.0.0",
-            "tools_available": len(TOOL_METADATA),
-            "tool_names": list(TOOL_METADATA.keys()),
-            "ocr_available": False,
-            "max_file_size_mb": 100,
-            "safety_features": [
-                "File size limits",
-                "Path traversal protection",
-                "File type validation",
-                "Timeout protection"
-            ]
-        }
-        return json.dumps(status, indent=2)
+        return _STATUS_JSON
 
     else:
         raise ValueError(f"Unknown resource URI: {uri}")
@@ -4,6 +4,7 @@ Covers argument parsing, the run_server vs test_server dispatch branches,
 KeyboardInterrupt handling, and the unexpected-exception exit path.
 """
 
+import importlib
 import sys
 from unittest.mock import patch
 
@@ -24,6 +25,24 @@ def test_parse_args_with_test_flag_sets_test_true():
     assert args.test is True
 
 
+def test_importing_entry_point_does_not_load_server(monkeypatch):
+    """The server module is only imported once main() has parsed arguments."""
+    monkeypatch.delitem(sys.modules, "pdf_reader.__main__", raising=False)
+    monkeypatch.delitem(sys.modules, "pdf_reader.server", raising=False)
+    importlib.import_module("pdf_reader.__main__")
+    assert "pdf_reader.server" not in sys.modules
+
+
+def test_main_help_exits_before_loading_server(monkeypatch):
+    """--help exits from argparse without importing the server module."""
+    monkeypatch.delitem(sys.modules, "pdf_reader.server", raising=False)
+    monkeypatch.setattr(sys, "argv", ["pdf_reader", "--help"])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 0
+    assert "pdf_reader.server" not in sys.modules
+
+
 def test_main_default_dispatches_to_run_server():
     """main() with no flags awaits run_server() once."""
     with patch("pdf_reader.__main__.asyncio.run") as mock_run, \
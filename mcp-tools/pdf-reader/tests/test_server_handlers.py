@@ -6,7 +6,9 @@ check / startup paths and the bundled self-test helper.
 """
 
 import json
+import logging
 import sys
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -21,6 +23,7 @@ from pdf_reader.server import (
 )
 # Import dev self-test under an alias so pytest does not collect it as a test.
 from pdf_reader.server import test_server as run_self_test
+from pdf_reader.tools import TOOL_METADATA
 
 
 # ---------------------------------------------------------------------------
@@ -117,6 +120,21 @@ async def test_call_tool_unknown_name_returns_user_input_error():
     assert payload["ok"] is False
     assert payload["code"] == "UserInput"
     assert "Unknown tool" in payload["message"]
+    assert payload["hint"] == "Available tools: " + ", ".join(TOOL_METADATA)
+
+
+@pytest.mark.asyncio
+async def test_call_tool_logs_argument_payload_only_at_debug(caplog):
+    """Argument values are JSON-encoded for the log only when DEBUG is enabled."""
+    args = {"values": [[1, 2]]}
+    with caplog.at_level(logging.INFO, logger="pdf_reader.server"):
+        await call_tool("nonexistent_tool", args)
+    assert "args=['values']" in caplog.text
+    assert "args-json" not in caplog.text
+
+    with caplog.at_level(logging.DEBUG, logger="pdf_reader.server"):
+        await call_tool("nonexistent_tool", args)
+    assert 'args-json={"values": [[1, 2]]}' in caplog.text
 
 
 @pytest.mark.asyncio
@@ -152,6 +170,18 @@ async def test_call_tool_non_envelope_result_normalized_to_envelope():
     assert payload["data"] == ["a", "b"]
 
 
+@pytest.mark.asyncio
+async def test_call_tool_serializes_non_json_values_as_strings():
+    """Responses keep the indented layout and stringify non-JSON values."""
+    result = {"ok": True, "data": {"path": Path("notes.md")}}
+    with patch(
+        "pdf_reader.server.tool_get_pdf_metadata",
+        new=AsyncMock(return_value=result),
+    ):
+        content = await call_tool("get_pdf_metadata", {})
+    assert content[0].text == json.dumps(result, indent=2, default=str)
+
+
 # ---------------------------------------------------------------------------
 # Resources
 # ---------------------------------------------------------------------------
@@ -183,6 +213,12 @@ async def test_read_resource_server_status_returns_metadata():
     assert isinstance(payload["tool_names"], list)
 
 
+@pytest.mark.asyncio
+async def test_read_resource_reuses_serialized_payload():
+    """Static resources are serialized once and returned as the same string."""
+    assert await read_resource("pdf://server-status") is await read_resource("pdf://server-status")
+
+
 @pytest.mark.asyncio
 async def test_read_resource_unknown_uri_raises_value_error():
     """Unknown resource URIs raise ValueError with the offending URI."""
@@ -47,10 +47,11 @@ class DataExporter:
             WorksheetError: If export fails
         """
         try:
-            # Get worksheet data
-            worksheet_data = self.excel_processor.get_worksheet_data(sheet_name)
+            # Raw value tuples; csv.writer renders None as an empty field
+            rows = self.excel_processor.iter_rows_values(sheet_name)
+            first_row = next(rows, None)
 
-            if not worksheet_data["data"]:
+            if first_row is None:
                 return success_response(
                     {
                         "sheet_name": sheet_name,
@@ -64,20 +65,11 @@ class DataExporter:
             writer = csv.writer(csv_content, delimiter=delimiter)
 
             rows_exported = 0
-            rows = worksheet_data["data"]
-            if not include_headers and rows:
-                rows = rows[1:]
-
-            for row_data in rows:
-                row_values = []
-                for cell in row_data:
-                    value = cell.get("value")
-                    # Handle None values and convert to string
-                    if value is None:
-                        row_values.append("")
-                    else:
-                        row_values.append(str(value))
+            if include_headers:
+                writer.writerow(first_row)
+                rows_exported += 1
 
+            for row_values in rows:
                 writer.writerow(row_values)
                 rows_exported += 1
 
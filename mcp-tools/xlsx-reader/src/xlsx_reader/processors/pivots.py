@@ -9,20 +9,65 @@ Handles pivot table extraction, modification, and creation.
 # pylint: disable=protected-access,broad-exception-caught
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
+
+import openpyxl
 
 from ..errors import PivotTableError
+from ..safety import validate_excel_file
 
 logger = logging.getLogger(__name__)
 
 
 class PivotTableProcessor:
-    """Handles Excel pivot table operations."""
+    """Handles Excel pivot table operations.
+
+    The ``extract_*``, ``iter_all_pivot_tables`` and ``get_pivot_data_summary``
+    methods never mutate the workbook, so several threads may call them on a
+    shared processor. The create/modify/delete methods are refused on
+    workbooks opened with ``read_only=True``.
+    """
 
     def __init__(self, workbook):
         """Create a pivot table processor for an openpyxl workbook."""
         self.workbook = workbook
 
+    @classmethod
+    def from_path(
+        cls, file_path: str, *, read_only: bool = False
+    ) -> "PivotTableProcessor":
+        """Load a workbook for pivot table work and wrap it in a processor.
+
+        External links are skipped, since pivot metadata does not need them.
+        Read-only loads also take cached cell values (``data_only=True``);
+        editable loads keep formulas so the workbook can be saved after
+        modifying pivot tables. Note that openpyxl does not parse pivot table
+        parts in read-only mode, so extraction needs the default
+        ``read_only=False``.
+
+        Args:
+            file_path: Path to Excel file
+            read_only: Whether to open the workbook in openpyxl read-only mode
+
+        Returns:
+            Processor bound to the loaded workbook
+
+        Raises:
+            PivotTableError: If the workbook cannot be loaded
+        """
+        try:
+            validated_path = validate_excel_file(file_path)
+            workbook = openpyxl.load_workbook(
+                validated_path,
+                read_only=read_only,
+                data_only=read_only,
+                keep_links=False,
+            )
+        except Exception as e:
+            raise PivotTableError(f"Failed to load workbook: {e}") from e
+
+        return cls(workbook)
+
     def extract_pivot_tables_from_sheet(self, sheet_name: str) -> List[Dict[str, Any]]:
         """Extract pivot table metadata from a worksheet.
 
@@ -44,18 +89,28 @@ class PivotTableProcessor:
 
             # Extract pivot table objects from worksheet
             if hasattr(sheet, "_pivots") and sheet._pivots:
+                # Bind helpers once rather than resolving them per pivot.
+                get_cache = self._get_cache_definition
+                get_location = self._get_pivot_location
+                get_fields = self._extract_pivot_fields
+                get_data_fields = self._extract_data_fields
+                get_row_fields = self._extract_row_fields
+                get_column_fields = self._extract_column_fields
+                get_filter_fields = self._extract_filter_fields
+                get_style = self._get_pivot_style
+
                 for i, pivot in enumerate(sheet._pivots):
                     pivot_info = {
                         "index": i,
                         "name": getattr(pivot, "name", f"PivotTable{i + 1}"),
-                        "cache_definition": self._get_cache_definition(pivot),
-                        "location": self._get_pivot_location(pivot),
-                        "fields": self._extract_pivot_fields(pivot),
-                        "data_fields": self._extract_data_fields(pivot),
-                        "row_fields": self._extract_row_fields(pivot),
-                        "column_fields": self._extract_column_fields(pivot),
-                        "filter_fields": self._extract_filter_fields(pivot),
-                        "style": self._get_pivot_style(pivot),
+                        "cache_definition": get_cache(pivot),
+                        "location": get_location(pivot),
+                        "fields": get_fields(pivot),
+                        "data_fields": get_data_fields(pivot),
+                        "row_fields": get_row_fields(pivot),
+                        "column_fields": get_column_fields(pivot),
+                        "filter_fields": get_filter_fields(pivot),
+                        "style": get_style(pivot),
                     }
                     pivot_tables.append(pivot_info)
 
@@ -78,18 +133,11 @@ class PivotTableProcessor:
         try:
             all_pivots = {}
 
-            for sheet_name in self.workbook.sheetnames:
-                try:
-                    pivots = self.extract_pivot_tables_from_sheet(sheet_name)
-                    if pivots:
-                        all_pivots[sheet_name] = pivots
-                except Exception as e:
-                    logger.warning(
-                        "Failed to extract pivot tables from '%s': %s",
-                        sheet_name,
-                        e,
-                    )
-                    all_pivots[sheet_name] = {"error": str(e)}
+            for sheet_name, pivot_info in self.iter_all_pivot_tables():
+                if "error" in pivot_info:
+                    all_pivots[sheet_name] = pivot_info
+                else:
+                    all_pivots.setdefault(sheet_name, []).append(pivot_info)
 
             return all_pivots
 
@@ -98,6 +146,31 @@ class PivotTableProcessor:
                 f"Failed to extract pivot tables from workbook: {e}"
             ) from e
 
+    def iter_all_pivot_tables(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield pivot tables from all worksheets one sheet at a time.
+
+        Only a single sheet's pivot tables are held in memory at once, so
+        callers can stream results for pivot-dense workbooks. A sheet that
+        fails to extract yields one ``{"error": ...}`` entry instead.
+
+        Yields:
+            Tuples of (sheet name, pivot table info)
+        """
+        for sheet_name in self.workbook.sheetnames:
+            try:
+                pivots = self.extract_pivot_tables_from_sheet(sheet_name)
+            except Exception as e:
+                logger.warning(
+                    "Failed to extract pivot tables from '%s': %s",
+                    sheet_name,
+                    e,
+                )
+                yield sheet_name, {"error": str(e)}
+                continue
+
+            for pivot_info in pivots:
+                yield sheet_name, pivot_info
+
     def create_pivot_table(
         self,
         source_sheet: str,
@@ -122,6 +195,8 @@ class PivotTableProcessor:
             PivotTableError: If pivot table creation fails
         """
         try:
+            self._ensure_writable()
+
             # Note: openpyxl has limited pivot table creation support
             # This is a placeholder implementation
             logger.warning("Pivot table creation has limited support in openpyxl")
@@ -168,6 +243,8 @@ class PivotTableProcessor:
             PivotTableError: If pivot table modification fails
         """
         try:
+            self._ensure_writable()
+
             if sheet_name not in self.workbook.sheetnames:
                 raise PivotTableError(f"Sheet '{sheet_name}' not found")
 
@@ -206,37 +283,77 @@ class PivotTableProcessor:
         Raises:
             PivotTableError: If pivot table deletion fails
         """
+        result = self.delete_pivot_tables(sheet_name, [pivot_index])
+
+        return {
+            "sheet_name": sheet_name,
+            "pivot_index": pivot_index,
+            "remaining_pivots": result["remaining_pivots"],
+            "deleted": bool(result["deleted"]),
+            "message": "Pivot table deletion may require manual verification",
+        }
+
+    def delete_pivot_tables(
+        self, sheet_name: str, indices: List[int]
+    ) -> Dict[str, Any]:
+        """Delete several pivot tables from the worksheet in one pass.
+
+        All indices are validated before anything is removed, then popped in
+        descending order so earlier removals never shift later ones. Negative
+        indices count from the end as with list indexing, and an index given
+        twice (in either form) is deleted once.
+
+        Args:
+            sheet_name: Name of worksheet containing the pivot tables
+            indices: Indices of pivot tables to delete
+
+        Returns:
+            Deleted and failed indices plus the remaining pivot count
+
+        Raises:
+            PivotTableError: If the sheet or any index is invalid
+        """
         try:
+            self._ensure_writable()
+
             if sheet_name not in self.workbook.sheetnames:
                 raise PivotTableError(f"Sheet '{sheet_name}' not found")
 
             sheet = self.workbook[sheet_name]
+            pivots = getattr(sheet, "_pivots", None)
 
-            if not hasattr(sheet, "_pivots") or not sheet._pivots:
+            if not pivots:
                 raise PivotTableError(f"No pivot tables found in sheet '{sheet_name}'")
 
-            if pivot_index >= len(sheet._pivots):
-                raise PivotTableError(f"Pivot table index {pivot_index} out of range")
+            count = len(pivots)
+            normalized = set()
+            for pivot_index in indices:
+                if not -count <= pivot_index < count:
+                    raise PivotTableError(
+                        f"Pivot table index {pivot_index} out of range"
+                    )
+                normalized.add(pivot_index % count)
 
-            # Remove pivot table (limited support)
-            try:
-                _ = sheet._pivots.pop(pivot_index)
-                deleted = True
-            except Exception:
-                deleted = False
+            deleted = []
+            failed = []
+            # Remove pivot tables (limited support)
+            for pivot_index in sorted(normalized, reverse=True):
+                try:
+                    pivots.pop(pivot_index)
+                    deleted.append(pivot_index)
+                except Exception:
+                    failed.append(pivot_index)
 
             return {
                 "sheet_name": sheet_name,
-                "pivot_index": pivot_index,
-                "remaining_pivots": len(sheet._pivots)
-                if hasattr(sheet, "_pivots")
-                else 0,
                 "deleted": deleted,
+                "failed": failed,
+                "remaining_pivots": len(pivots),
                 "message": "Pivot table deletion may require manual verification",
             }
 
         except Exception as e:
-            raise PivotTableError(f"Failed to delete pivot table: {e}") from e
+            raise PivotTableError(f"Failed to delete pivot tables: {e}") from e
 
     def get_pivot_data_summary(
         self, sheet_name: str, pivot_index: int
@@ -286,6 +403,14 @@ class PivotTableProcessor:
 
     # Helper methods
 
+    def _ensure_writable(self) -> None:
+        """Raise if the workbook was opened in read-only mode."""
+        if getattr(self.workbook, "read_only", False):
+            raise PivotTableError(
+                "Workbook is opened read-only; "
+                "reload with read_only=False to modify pivot tables"
+            )
+
     def _get_cache_definition(self, pivot) -> Dict[str, Any]:
         """Get pivot table cache definition."""
         try:
@@ -3,20 +3,52 @@
 Handles reading, writing, and manipulating Excel workbooks using openpyxl.
 """
 
+import datetime
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import openpyxl
 from openpyxl import Workbook
 from openpyxl.cell import Cell
 from openpyxl.styles import Alignment, Fill, Font
+from openpyxl.utils.cell import get_column_letter, range_boundaries
 
 from ..errors import WorkbookError, WorksheetError
 from ..safety import validate_cell_reference, validate_excel_file, validate_sheet_name
 
+try:
+    from python_calamine import CalamineWorkbook
+
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+    CalamineWorkbook = None
+
 logger = logging.getLogger(__name__)
 
+# Default styles that cells are compared against; built once instead of per
+# cell.
+_DEFAULT_FONT = Font()
+_DEFAULT_ALIGNMENT = Alignment()
+
+
+def _calamine_to_openpyxl(value: Any) -> Any:
+    """Map a calamine cell value to what openpyxl returns for the same cell.
+
+    calamine reports empty cells as ``""``, every number as a float and
+    whole-day dates as ``date``; openpyxl gives ``None``, an ``int`` for
+    integral numbers and a ``datetime`` for any date-formatted cell. Times,
+    durations and datetimes already match.
+    """
+    if value == "":
+        return None
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        return datetime.datetime.combine(value, datetime.time())
+    return value
+
 
 class ExcelProcessor:
     """Core Excel workbook processor with read/write capabilities."""
@@ -25,25 +57,64 @@ class ExcelProcessor:
         """Initialize the processor with no workbook loaded."""
         self._workbook: Optional[Workbook] = None
         self._file_path: Optional[Path] = None
+        self._file_path_str: Optional[str] = None
+        self._dirty = False
+        # (max_row, max_column) per sheet title; cleared by any edit
+        self._bounds_cache: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
 
     def is_workbook_loaded(self) -> bool:
         """Return True if a workbook is currently loaded."""
         return self._workbook is not None
 
+    def has_unsaved_changes(self) -> bool:
+        """Return True if the loaded workbook was edited since it was last saved."""
+        return self._dirty
+
     def get_loaded_file_path(self) -> Optional[Path]:
         """Return the currently loaded workbook path, if any."""
         return self._file_path
 
     def get_loaded_file_path_str(self) -> Optional[str]:
         """Return the currently loaded workbook path as a string, if any."""
-        return str(self._file_path) if self._file_path else None
+        return self._file_path_str
+
+    def is_loaded(self, file_path: str) -> bool:
+        """Return True if ``file_path`` names the currently loaded workbook.
+
+        The comparison is made on resolved paths, so aliases such as
+        ``./book.xlsx`` and ``book.xlsx`` match the same loaded workbook.
+        """
+        if self._workbook is None or self._file_path_str is None:
+            return False
+        try:
+            return str(Path(file_path).resolve()) == self._file_path_str
+        except (OSError, TypeError, ValueError):
+            return False
 
-    def load_workbook(self, file_path: str, read_only: bool = False) -> Dict[str, Any]:
+    def load_workbook(
+        self,
+        file_path: str,
+        read_only: bool = False,
+        data_only: bool = False,
+        keep_vba: bool = False,
+        keep_links: bool = True,
+        reset_dimensions: bool = False,
+    ) -> Dict[str, Any]:
         """Load an Excel workbook from file.
 
+        Read-only sheets trust the dimension recorded in the file, which some
+        writers get wrong (e.g. claiming ``A1:XFD1048576``); iterating such a
+        sheet walks the whole phantom range. ``reset_dimensions`` discards the
+        recorded dimensions so rows are read only as far as they exist; the
+        sheets then report ``None`` for ``max_row`` and ``max_column``.
+
         Args:
             file_path: Path to Excel file
             read_only: Whether to open in read-only mode
+            data_only: Load cached cell values instead of formulas
+            keep_vba: Preserve VBA content so it is written back on save
+            keep_links: Load external workbook links
+            reset_dimensions: Ignore recorded sheet dimensions (read-only only)
 
         Returns:
             Workbook metadata
@@ -54,13 +125,21 @@ class ExcelProcessor:
         try:
             validated_path = validate_excel_file(file_path)
             self._file_path = validated_path
+            self._file_path_str = str(validated_path)
+            self._dirty = False
+            self._bounds_cache.clear()
 
             # Load workbook with openpyxl
             self._workbook = openpyxl.load_workbook(
                 validated_path,
                 read_only=read_only,
-                data_only=False,  # Keep formulas
+                data_only=data_only,
+                keep_vba=keep_vba,
+                keep_links=keep_links,
             )
+            if read_only and reset_dimensions:
+                for sheet in self._workbook.worksheets:
+                    sheet.reset_dimensions()
 
             logger.info("Loaded workbook: %s", validated_path)
 
@@ -82,52 +161,106 @@ class ExcelProcessor:
             raise WorkbookError("No workbook loaded")
 
         try:
-            sheet_info = []
-            for sheet_name in self._workbook.sheetnames:
-                sheet = self._workbook[sheet_name]
-                info = {
-                    "name": sheet_name,
-                    "max_row": sheet.max_row,
-                    "max_column": sheet.max_column,
-                    "data_only": hasattr(sheet, "parent") and sheet.parent.data_only,
-                }
-
-                # Get sheet dimensions with data
-                if sheet.max_row > 0 and sheet.max_column > 0:
-                    info["dimensions"] = (
-                        f"A1:{sheet.cell(sheet.max_row, sheet.max_column).coordinate}"
-                    )
-                else:
-                    info["dimensions"] = "A1:A1"
-
-                sheet_info.append(info)
+            workbook = self._workbook
+            sheet_names = workbook.sheetnames
+            data_only = getattr(workbook, "data_only", False)
+            sheet_info = [
+                self._probe_sheet(sheet, data_only) for sheet in workbook.worksheets
+            ]
+            active = workbook.active
 
             return {
-                "file_path": str(self._file_path) if self._file_path else None,
-                "sheet_count": len(self._workbook.sheetnames),
-                "sheet_names": self._workbook.sheetnames,
+                "file_path": self._file_path_str,
+                "sheet_count": len(sheet_names),
+                "sheet_names": sheet_names,
                 "sheets": sheet_info,
-                "active_sheet": self._workbook.active.title
-                if self._workbook.active
-                else None,
-                "has_formulas": not getattr(self._workbook, "data_only", False),
+                "active_sheet": active.title if active else None,
+                "has_formulas": not data_only,
             }
 
         except Exception as e:
             raise WorkbookError(f"Failed to get workbook info: {e}") from e
 
+    def _sheet_bounds(
+        self, sheet: Any, measure: bool = False
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Return ``(max_row, max_column)`` for ``sheet``, memoized per sheet.
+
+        On an editable sheet both properties scan every stored cell, and on a
+        read-only one they may re-read the dimension; the result only changes
+        when the workbook is edited, which clears the cache.
+
+        A read-only sheet without a recorded dimension reports ``None``. With
+        ``measure`` such a sheet is scanned once to find its used area, which
+        callers reading the whole sheet need.
+        """
+        bounds = self._bounds_cache.get(sheet.title)
+        if bounds is None or (measure and None in bounds):
+            if measure and (sheet.max_row is None or sheet.max_column is None):
+                sheet.calculate_dimension(force=True)
+            bounds = (sheet.max_row, sheet.max_column)
+            self._bounds_cache[sheet.title] = bounds
+        return bounds
+
+    def _mark_dirty(self) -> None:
+        """Record an edit: unsaved changes exist and cached bounds are stale."""
+        self._dirty = True
+        self._bounds_cache.clear()
+
+    def _get_sheet(self, sheet_name: str) -> Any:
+        """Return the sheet called ``sheet_name``.
+
+        A single lookup replaces the ``sheetnames`` membership test followed by
+        ``workbook[sheet_name]``, which each walk the sheet list.
+
+        Raises:
+            WorksheetError: If the workbook has no such sheet
+        """
+        try:
+            return self._workbook[sheet_name]
+        except KeyError:
+            raise WorksheetError(f"Sheet '{sheet_name}' not found") from None
+
+    def _probe_sheet(self, sheet: Any, data_only: bool) -> Dict[str, Any]:
+        """Return the metadata entry for one worksheet."""
+        max_row, max_column = self._sheet_bounds(sheet)
+
+        # Built from the bounds rather than a cell lookup, which yields a
+        # coordinate-less EmptyCell on read-only sheets.
+        if max_row is None or max_column is None:
+            dimensions = None
+        elif max_row > 0 and max_column > 0:
+            dimensions = f"A1:{get_column_letter(max_column)}{max_row}"
+        else:
+            dimensions = "A1:A1"
+
+        return {
+            "name": sheet.title,
+            "max_row": max_row,
+            "max_column": max_column,
+            "data_only": data_only,
+            "dimensions": dimensions,
+        }
+
     def get_worksheet_data(
         self,
         sheet_name: Optional[str] = None,
         include_formulas: bool = False,
         cell_range: Optional[str] = None,
+        shape: str = "cells",
     ) -> Dict[str, Any]:
         """Get data from a specific worksheet.
 
+        With ``shape="cells"`` every cell is returned as a dictionary carrying
+        its coordinate, type, number format and styling. ``shape="flat"``
+        returns ``data`` as a plain 2D list of values instead, with one type
+        name per column, which is several times smaller for large sheets.
+
         Args:
             sheet_name: Name of sheet (active sheet if None)
             include_formulas: Whether to include formula strings
             cell_range: Specific cell range to read (e.g., "A1:D10")
+            shape: Result layout, either "cells" or "flat"
 
         Returns:
             Dictionary with worksheet data
@@ -138,27 +271,30 @@ class ExcelProcessor:
         if not self._workbook:
             raise WorksheetError("No workbook loaded")
 
+        if shape == "flat":
+            return self._get_worksheet_values(sheet_name, include_formulas, cell_range)
+        if shape != "cells":
+            raise WorksheetError(f"Unsupported data shape: {shape}")
+
         try:
             # Get worksheet
             if sheet_name:
                 validate_sheet_name(sheet_name)
-                if sheet_name not in self._workbook.sheetnames:
-                    raise WorksheetError(f"Sheet '{sheet_name}' not found")
-                sheet = self._workbook[sheet_name]
+                sheet = self._get_sheet(sheet_name)
             else:
                 sheet = self._workbook.active
                 sheet_name = sheet.title
 
-            # Determine cell range
+            # Determine cell range; only a whole-sheet read needs the bounds
             if cell_range:
                 validate_cell_reference(cell_range)
                 cells = sheet[cell_range]
             else:
                 # Get all data range
-                if sheet.max_row > 0 and sheet.max_column > 0:
-                    cells = sheet[
-                        f"A1:{sheet.cell(sheet.max_row, sheet.max_column).coordinate}"
-                    ]
+                max_row, max_column = self._sheet_bounds(sheet, measure=True)
+                cell_range = f"A1:{get_column_letter(max_column or 1)}{max_row or 1}"
+                if max_row > 0 and max_column > 0:
+                    cells = sheet[cell_range]
                 else:
                     cells = []
 
@@ -197,11 +333,11 @@ class ExcelProcessor:
                                 cell_info["formula"] = getattr(cell, "formula")
 
                         # Add formatting info
-                        if cell.font and cell.font != Font():
+                        if cell.font and cell.font != _DEFAULT_FONT:
                             cell_info["font"] = self._serialize_font(cell.font)
                         if cell.fill and cell.fill.patternType:
                             cell_info["fill"] = self._serialize_fill(cell.fill)
-                        if cell.alignment and cell.alignment != Alignment():
+                        if cell.alignment and cell.alignment != _DEFAULT_ALIGNMENT:
                             cell_info["alignment"] = self._serialize_alignment(
                                 cell.alignment
                             )
@@ -211,8 +347,7 @@ class ExcelProcessor:
 
             return {
                 "sheet_name": sheet_name,
-                "range": cell_range
-                or f"A1:{sheet.cell(sheet.max_row, sheet.max_column).coordinate}",
+                "range": cell_range,
                 "rows": len(rows_data),
                 "columns": len(rows_data[0]) if rows_data else 0,
                 "data": rows_data,
@@ -221,6 +356,151 @@ class ExcelProcessor:
         except Exception as e:
             raise WorksheetError(f"Failed to read worksheet data: {e}") from e
 
+    def _get_worksheet_values(
+        self,
+        sheet_name: Optional[str],
+        include_formulas: bool,
+        cell_range: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build the ``shape="flat"`` result of :meth:`get_worksheet_data`."""
+        rows = self.iter_rows_values(sheet_name, cell_range)
+        try:
+            sheet = self._workbook[sheet_name] if sheet_name else self._workbook.active
+            if cell_range:
+                min_col, min_row, _, _ = range_boundaries(cell_range)
+            else:
+                min_col = min_row = 1
+                max_row, max_column = self._sheet_bounds(sheet, measure=True)
+                cell_range = (
+                    f"A1:{get_column_letter(max_column or 1)}{max_row or 1}"
+                )
+
+            data = None
+            # A read-only data_only load only sees the file's cached values,
+            # which is exactly what calamine reads; its Rust parser is much
+            # faster than openpyxl on large sheets. Failures fall back.
+            workbook = self._workbook
+            if (
+                CALAMINE_AVAILABLE
+                and not include_formulas
+                and workbook.data_only
+                and workbook.read_only
+            ):
+                try:
+                    data = self._read_values_with_calamine(sheet.title, cell_range)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.debug("calamine read failed, using openpyxl: %s", e)
+            if data is None:
+                data = [list(row) for row in rows]
+            width = max((len(row) for row in data), default=0)
+
+            dtypes = []
+            for col in range(width):
+                names = {
+                    type(row[col]).__name__
+                    for row in data
+                    if col < len(row) and row[col] is not None
+                }
+                if not names:
+                    dtypes.append("empty")
+                else:
+                    dtypes.append(names.pop() if len(names) == 1 else "mixed")
+
+            formulas = None
+            if include_formulas:
+                formulas = {
+                    f"{get_column_letter(min_col + c)}{min_row + r}": value
+                    for r, row in enumerate(data)
+                    for c, value in enumerate(row)
+                    if isinstance(value, str) and value.startswith("=")
+                }
+
+            return {
+                "sheet_name": sheet.title,
+                "range": cell_range,
+                "shape": "flat",
+                "rows": len(data),
+                "columns": width,
+                "dtypes": dtypes,
+                "formulas": formulas,
+                "data": data,
+            }
+
+        except Exception as e:
+            raise WorksheetError(f"Failed to read worksheet data: {e}") from e
+
+    def _read_values_with_calamine(
+        self, sheet_title: str, cell_range: str
+    ) -> List[List[Any]]:
+        """Read cached cell values of ``cell_range`` straight from the file.
+
+        Rows are shaped like :meth:`iter_rows_values` on a read-only sheet:
+        one list per row up to the last used row, padded with ``None``, with
+        each value mapped by :func:`_calamine_to_openpyxl`.
+        """
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+        width = max_col - min_col + 1
+
+        with CalamineWorkbook.from_path(str(self._file_path)) as workbook:
+            rows = workbook.get_sheet_by_name(sheet_title).to_python(
+                skip_empty_area=False
+            )
+
+        data = []
+        for source in rows[min_row - 1 : max_row]:
+            row = [
+                _calamine_to_openpyxl(value) for value in source[min_col - 1 : max_col]
+            ]
+            row.extend([None] * (width - len(row)))
+            data.append(row)
+        return data
+
+    def iter_rows_values(
+        self, sheet_name: Optional[str] = None, cell_range: Optional[str] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Iterate over raw cell values of a worksheet, one tuple per row.
+
+        Uses openpyxl's ``values_only`` fast path, which skips building a
+        ``Cell`` object and a per-cell dictionary for every entry. Empty
+        cells come back as ``None`` so every row keeps its column positions.
+
+        Args:
+            sheet_name: Name of sheet (active sheet if None)
+            cell_range: Specific cell range to read (e.g., "A1:D10")
+
+        Returns:
+            Iterator of row value tuples
+
+        Raises:
+            WorksheetError: If sheet access fails
+        """
+        if not self._workbook:
+            raise WorksheetError("No workbook loaded")
+
+        try:
+            if sheet_name:
+                validate_sheet_name(sheet_name)
+                sheet = self._get_sheet(sheet_name)
+            else:
+                sheet = self._workbook.active
+
+            if cell_range:
+                min_col, min_row, max_col, max_row = range_boundaries(
+                    validate_cell_reference(cell_range)
+                )
+                return sheet.iter_rows(
+                    min_row=min_row,
+                    max_row=max_row,
+                    min_col=min_col,
+                    max_col=max_col,
+                    values_only=True,
+                )
+
+            return sheet.iter_rows(values_only=True)
+
+        except Exception as e:
+            raise WorksheetError(f"Failed to read worksheet rows: {e}") from e
+
     def update_cell_value(
         self, sheet_name: str, cell_ref: str, value: Any, formula: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -245,16 +525,14 @@ class ExcelProcessor:
             validate_sheet_name(sheet_name)
             validate_cell_reference(cell_ref)
 
-            if sheet_name not in self._workbook.sheetnames:
-                raise WorksheetError(f"Sheet '{sheet_name}' not found")
-
-            sheet = self._workbook[sheet_name]
+            sheet = self._get_sheet(sheet_name)
             cell = sheet[cell_ref]
 
             if formula:
                 cell.value = f"={formula.lstrip('=')}"
             else:
                 cell.value = value
+            self._mark_dirty()
 
             return {
                 "coordinate": cell.coordinate,
@@ -289,10 +567,7 @@ class ExcelProcessor:
             validate_sheet_name(sheet_name)
             validate_cell_reference(cell_range)
 
-            if sheet_name not in self._workbook.sheetnames:
-                raise WorksheetError(f"Sheet '{sheet_name}' not found")
-
-            sheet = self._workbook[sheet_name]
+            sheet = self._get_sheet(sheet_name)
             cells = sheet[cell_range]
 
             # Ensure cells is 2D
@@ -301,15 +576,15 @@ class ExcelProcessor:
             elif len(cells) > 0 and isinstance(cells[0], Cell):
                 cells = [cells]
 
+            # zip stops at the shorter of range and values on both axes, so
+            # short rows only update their leading cells.
             updated_count = 0
-            for row_idx, cell_row in enumerate(cells):
-                if row_idx >= len(values):
-                    break
-                for col_idx, cell in enumerate(cell_row):
-                    if col_idx >= len(values[row_idx]):
-                        break
-                    cell.value = values[row_idx][col_idx]
+            for cell_row, row_values in zip(cells, values):
+                for cell, value in zip(cell_row, row_values):
+                    cell.value = value
                     updated_count += 1
+            if updated_count:
+                self._mark_dirty()
 
             return {
                 "range": cell_range,
@@ -346,6 +621,7 @@ class ExcelProcessor:
                 raise WorksheetError(f"Sheet '{validated_name}' already exists")
 
             sheet = self._workbook.create_sheet(validated_name, index)
+            self._mark_dirty()
 
             return {
                 "name": sheet.title,
@@ -382,6 +658,7 @@ class ExcelProcessor:
 
             sheet = self._workbook[sheet_name]
             self._workbook.remove(sheet)
+            self._mark_dirty()
 
             return {
                 "deleted_sheet": sheet_name,
@@ -416,6 +693,7 @@ class ExcelProcessor:
                 raise WorkbookError("No file path specified for save")
 
             self._workbook.save(save_path)
+            self._dirty = False
 
             return {
                 "saved_to": str(save_path),
@@ -432,6 +710,9 @@ class ExcelProcessor:
             self._workbook.close()
             self._workbook = None
             self._file_path = None
+            self._file_path_str = None
+            self._dirty = False
+            self._bounds_cache.clear()
             logger.info("Workbook closed")
 
     # Helper methods for serialization
@@ -12,11 +12,24 @@ from filelock import FileLock
 
 from .errors import FileAccessError, ValidationError
 
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 # Configuration constants
 MAX_FILE_SIZE_BYTES = 200 * 1024 * 1024  # 200MB default
 BACKUP_SUFFIX = ".backup"
+EXCEL_EXTENSIONS = frozenset({".xlsx", ".xlsm", ".xltx", ".xltm"})
+
+# Linux FICLONE ioctl: make the destination share the source's extents
+# (copy-on-write) on filesystems that support reflinks, e.g. btrfs and XFS.
+FICLONE = 0x40049409
 
 
 def validate_file_path(file_path: str) -> Path:
@@ -87,11 +100,10 @@ def validate_excel_file(file_path: str) -> Path:
     path = validate_file_path(file_path)
 
     # Check file extension
-    valid_extensions = {".xlsx", ".xlsm", ".xltx", ".xltm"}
-    if path.suffix.lower() not in valid_extensions:
+    if path.suffix.lower() not in EXCEL_EXTENSIONS:
         raise ValidationError(
             f"Invalid Excel file extension: {path.suffix}. "
-            f"Supported: {', '.join(valid_extensions)}"
+            f"Supported: {', '.join(sorted(EXCEL_EXTENSIONS))}"
         )
 
     validate_file_size(path)
@@ -99,6 +111,31 @@ def validate_excel_file(file_path: str) -> Path:
     return path
 
 
+def _clone_file(source: Path, destination: Path) -> bool:
+    """Create ``destination`` as a copy-on-write clone of ``source``.
+
+    Cloning is O(1) regardless of file size, but only works on filesystems
+    with reflink support. A hardlink would be cheaper still but is not a safe
+    backup: openpyxl rewrites the saved file in place, which would change the
+    backup too.
+
+    Returns:
+        True if the clone was created, False if the caller should copy instead
+    """
+    if not FCNTL_AVAILABLE:
+        return False
+
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+
+    shutil.copystat(source, destination)
+    return True
+
+
 def create_backup(file_path: Path) -> Path:
     """Create a backup copy of a file before modification.
 
@@ -114,7 +151,8 @@ def create_backup(file_path: Path) -> Path:
     backup_path = file_path.with_suffix(file_path.suffix + BACKUP_SUFFIX)
 
     try:
-        shutil.copy2(file_path, backup_path)
+        if not _clone_file(file_path, backup_path):
+            shutil.copy2(file_path, backup_path)
         logger.info("Created backup: %s", backup_path)
         return backup_path
     except Exception as e:
@@ -7,306 +7,543 @@ Provides comprehensive Excel workbook reading and editing capabilities.
 # error envelopes instead of crashing.
 # pylint: disable=broad-exception-caught
 
+import asyncio
+import csv
+import datetime
+import functools
+import io
 import json
 import logging
-import sys
-from typing import Any, Dict, List
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 # MCP imports
 try:
     from mcp.server import Server
+    from mcp.server.stdio import stdio_server
     from mcp.types import Resource, TextContent, Tool
 except ImportError as exc:
     raise ImportError("MCP library not installed. Install with: pip install mcp") from exc
 
-from .errors import internal_error, success_response, user_input_error
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+from .errors import (
+    WorkbookError,
+    internal_error,
+    success_response,
+    user_input_error,
+)
 from .processors.workbook import ExcelProcessor
-from .safety import FileOperationContext
+from .safety import FileOperationContext, validate_excel_file
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stderr)],
-)
+# Handlers are configured by the entry point (__main__.setup_logging)
 logger = logging.getLogger(__name__)
 
 # Create MCP server instance
 server = Server("xlsx-reader")
 
-# Global processor instance
-excel_processor = ExcelProcessor()
 
+def _json_default(obj: Any) -> str:
+    """Encode values the JSON encoder has no native support for.
 
-@server.list_resources()
-async def handle_list_resources() -> List[Resource]:
-    """List available resources."""
-    return [
-        Resource(
-            uri="xlsx://supported-formats",
-            name="Supported Excel Formats",
-            description="List of supported Excel file formats and extensions",
-            mimeType="application/json",
-        ),
-        Resource(
-            uri="xlsx://server-status",
-            name="Server Status",
-            description="Current server status and loaded workbook information",
-            mimeType="application/json",
-        ),
-    ]
+    Dates and times use ISO 8601 so both encoders agree: orjson serializes
+    them natively in that form and never calls this for them.
+    """
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response compactly, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode("utf-8")
+    return json.dumps(obj, default=_json_default, separators=(",", ":"))
+
+
+# Write buffer for CSV exports streamed to disk, so large exports are
+# flushed in big chunks instead of held in memory as one string.
+CSV_WRITE_BUFFER_BYTES = 1 << 20
+
+# Blocking openpyxl and file work runs on this pool so the event loop stays
+# responsive while a large workbook is parsed or saved.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="xlsx-io")
+
+# One lock per resolved workbook path; handlers hold it for the whole
+# operation so two calls never touch the same workbook concurrently. The
+# holder and any waiters keep a lock alive, so a path's entry disappears
+# once nobody is using it instead of accumulating for every file ever seen.
+_path_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
 
+# Loaded workbooks keyed by (resolved path, mtime_ns, read_only, data_only),
+# most recently used last. Parsing a large workbook can take seconds, so repeated
+# calls against the same unchanged file reuse the already-loaded processor.
+# Only ever mutated from the event loop thread.
+MAX_CACHED_WORKBOOKS = 4
+_workbook_cache: "OrderedDict[Tuple[str, int, bool, bool], ExcelProcessor]" = (
+    OrderedDict()
+)
 
-@server.read_resource()
-async def handle_read_resource(uri: str) -> str:
-    """Handle resource reading requests."""
-    logger.info("Resource requested: %s", uri)
+# read_workbook_info results keyed by resolved path, stored with the file's
+# (mtime_ns, size) at the time they were computed. A poll against an
+# unchanged file is answered without touching the workbook at all.
+_workbook_info_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
 
-    if uri == "xlsx://supported-formats":
-        formats = {
-            "supported_extensions": [".xlsx", ".xlsm", ".xltx", ".xltm"],
-            "descriptions": {
-                ".xlsx": "Excel Workbook (OpenXML format)",
-                ".xlsm": "Excel Macro-Enabled Workbook",
-                ".xltx": "Excel Template",
-                ".xltm": "Excel Macro-Enabled Template",
-            },
-            "max_file_size_mb": 200,
-            "capabilities": [
-                "Read workbook metadata",
-                "Read/write worksheet data",
-                "Extract/modify charts",
-                "Extract/modify pivot tables",
-                "Cell formatting",
-                "Data validation",
-                "Export to CSV/JSON",
-            ],
-        }
-        return json.dumps(formats, indent=2)
 
-    elif uri == "xlsx://server-status":
-        try:
-            workbook_info = (
-                excel_processor.get_workbook_info()
-                if excel_processor.is_workbook_loaded()
-                else None
-            )
-        except Exception:
-            workbook_info = None
+async def _run_io(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on the I/O thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _IO_EXECUTOR, functools.partial(func, *args, **kwargs)
+    )
 
-        status = {
-            "server": "xlsx-reader",
-            "version": "1.0.0",
-            "status": "running",
-            "workbook_loaded": workbook_info is not None,
-            "current_workbook": workbook_info,
-        }
-        return json.dumps(status, indent=2)
 
+def _path_lock(file_path: str) -> asyncio.Lock:
+    """Return the lock guarding the workbook at ``file_path``."""
+    path_str = str(Path(file_path).resolve())
+    lock = _path_locks.get(path_str)
+    if lock is None:
+        lock = _path_locks[path_str] = asyncio.Lock()
+    return lock
+
+
+def _is_in_use(path_str: str) -> bool:
+    """Return True if a handler currently holds the lock for ``path_str``."""
+    lock = _path_locks.get(path_str)
+    return lock is not None and lock.locked()
+
+
+async def _get_processor(
+    file_path: str, read_only: bool, data_only: bool = False
+) -> ExcelProcessor:
+    """Return a processor with ``file_path`` loaded, reusing a cached one.
+
+    A read-only formula request is served by an editable processor for the
+    same file when one is cached, so reads observe edits that have not been
+    saved yet. ``data_only`` read-only loads skip formulas and external links
+    and normally use their own cache entry, since an editable workbook holds
+    formula strings where the cached values should be. While an editable
+    processor for the file has unsaved edits, though, value reads are served
+    from it so every tool sees the same contents; formula cells then come
+    back as formula strings, as there are no computed values until the file
+    is saved and recalculated. ``data_only`` is ignored for editable loads,
+    which must keep formulas to save them back.
+
+    Entries for an older version of the file are dropped, and least recently
+    used entries that are neither held by another handler nor carrying
+    unsaved edits are closed once the cache exceeds its capacity.
+
+    Raises:
+        WorkbookError: If the file changed on disk while a cached processor
+            for it still has unsaved edits.
+    """
+    path = validate_excel_file(file_path)
+    path_str = str(path)
+    mtime_ns = path.stat().st_mtime_ns
+    data_only = data_only and read_only
+
+    editable_key = (path_str, mtime_ns, False, False)
+    if data_only:
+        editable = _workbook_cache.get(editable_key)
+        if editable is not None and editable.has_unsaved_changes():
+            candidates = [editable_key]
+        else:
+            candidates = [(path_str, mtime_ns, True, True)]
     else:
-        raise ValueError(f"Unknown resource URI: {uri}")
+        candidates = [editable_key]
+        if read_only:
+            candidates.append((path_str, mtime_ns, True, False))
+    for key in candidates:
+        processor = _workbook_cache.get(key)
+        if processor is not None:
+            _workbook_cache.move_to_end(key)
+            return processor
+
+    stale = [k for k in _workbook_cache if k[0] == path_str and k[1] != mtime_ns]
+    if any(_workbook_cache[k].has_unsaved_changes() for k in stale):
+        # Reloading would silently drop the edits; saving them is still
+        # possible since save_workbook finds the processor whatever its mtime.
+        logger.warning("%s changed on disk while it has unsaved changes", path_str)
+        raise WorkbookError(
+            f"'{path.name}' changed on disk while it has unsaved changes; "
+            "save the workbook (or save it elsewhere with save_as_path) first"
+        )
+    for key in stale:
+        _workbook_cache.pop(key).close_workbook()
+
+    processor = ExcelProcessor()
+    if data_only:
+        await _run_io(
+            processor.load_workbook,
+            path_str,
+            read_only=True,
+            data_only=True,
+            keep_links=False,
+        )
+    elif read_only:
+        # Read-only workbooks are never saved, so external links are not needed
+        await _run_io(
+            processor.load_workbook, path_str, read_only=True, keep_links=False
+        )
+    else:
+        await _run_io(processor.load_workbook, path_str, read_only=False)
+    new_key = (path_str, mtime_ns, read_only, data_only)
+    _workbook_cache[new_key] = processor
+
+    evictable = [
+        k
+        for k, cached in _workbook_cache.items()
+        if k != new_key
+        and not _is_in_use(k[0])
+        and not cached.has_unsaved_changes()
+    ]
+    while len(_workbook_cache) > MAX_CACHED_WORKBOOKS and evictable:
+        _workbook_cache.pop(evictable.pop(0)).close_workbook()
+
+    return processor
+
+
+def _find_editable_processor(
+    file_path: str,
+) -> Optional[Tuple[Tuple[str, int, bool, bool], ExcelProcessor]]:
+    """Return the cached editable processor for ``file_path``, if any."""
+    path_str = str(Path(file_path).resolve())
+    for key in reversed(_workbook_cache):
+        if key[0] == path_str and not key[2]:
+            return key, _workbook_cache[key]
+    return None
+
+
+def _close_cached_workbooks() -> None:
+    """Close and forget every cached workbook."""
+    while _workbook_cache:
+        key, processor = _workbook_cache.popitem()
+        if processor.has_unsaved_changes():
+            logger.warning("Discarding unsaved changes to %s", key[0])
+        processor.close_workbook()
+
+
+# Static listings are built once; the handlers hand back the same objects.
+_RESOURCES: List[Resource] = [
+    Resource(
+        uri="xlsx://supported-formats",
+        name="Supported Excel Formats",
+        description="List of supported Excel file formats and extensions",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="xlsx://server-status",
+        name="Server Status",
+        description="Current server status and loaded workbook information",
+        mimeType="application/json",
+    ),
+]
+
+_SUPPORTED_FORMATS_JSON = json.dumps(
+    {
+        "supported_extensions": [".xlsx", ".xlsm", ".xltx", ".xltm"],
+        "descriptions": {
+            ".xlsx": "Excel Workbook (OpenXML format)",
+            ".xlsm": "Excel Macro-Enabled Workbook",
+            ".xltx": "Excel Template",
+            ".xltm": "Excel Macro-Enabled Template",
+        },
+        "max_file_size_mb": 200,
+        "capabilities": [
+            "Read workbook metadata",
+            "Read/write worksheet data",
+            "Extract/modify charts",
+            "Extract/modify pivot tables",
+            "Cell formatting",
+            "Data validation",
+            "Export to CSV/JSON",
+        ],
+    },
+    indent=2,
+)
 
+_STATIC_STATUS: Dict[str, Any] = {
+    "server": "xlsx-reader",
+    "version": "1.0.0",
+    "status": "running",
+}
+
+# Status served while no workbook is cached; polling clients get this string
+# back without any per-request work.
+_EMPTY_STATUS_JSON = json.dumps(
+    dict(
+        _STATIC_STATUS,
+        workbook_loaded=False,
+        current_workbook=None,
+        cached_workbooks=0,
+    ),
+    indent=2,
+)
 
-@server.list_tools()
-async def handle_list_tools() -> List[Tool]:
-    """List available tools."""
-    return [
-        # Reading tools
-        Tool(
-            name="read_workbook_info",
-            description="Read Excel workbook metadata and sheet information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to Excel file",
-                    },
-                    "read_only": {
-                        "type": "boolean",
-                        "description": "Open in read-only mode",
-                        "default": True,
-                    },
+_TOOLS: List[Tool] = [
+    # Reading tools
+    Tool(
+        name="read_workbook_info",
+        description="Read Excel workbook metadata and sheet information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to Excel file",
+                },
+                "read_only": {
+                    "type": "boolean",
+                    "description": "Open in read-only mode",
+                    "default": True,
                 },
-                "required": ["file_path"],
             },
-        ),
-        Tool(
-            name="read_worksheet_data",
-            description="Read data from a specific worksheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to Excel file",
-                    },
-                    "sheet_name": {
-                        "type": "string",
-                        "description": "Name of worksheet (active sheet if not specified)",
-                    },
-                    "include_formulas": {
-                        "type": "boolean",
-                        "description": "Include formula strings",
-                        "default": False,
-                    },
-                    "cell_range": {
-                        "type": "string",
-                        "description": "Specific cell range (e.g., 'A1:D10')",
-                    },
+            "required": ["file_path"],
+        },
+    ),
+    Tool(
+        name="read_worksheet_data",
+        description="Read data from a specific worksheet",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to Excel file",
+                },
+                "sheet_name": {
+                    "type": "string",
+                    "description": "Name of worksheet (active sheet if not specified)",
+                },
+                "include_formulas": {
+                    "type": "boolean",
+                    "description": "Include formula strings",
+                    "default": False,
+                },
+                "cell_range": {
+                    "type": "string",
+                    "description": "Specific cell range (e.g., 'A1:D10')",
+                },
+                "shape": {
+                    "type": "string",
+                    "enum": ["flat", "cells"],
+                    "description": (
+                        "'flat' returns a 2D array of values; 'cells' returns "
+                        "per-cell metadata and formatting"
+                    ),
+                    "default": "flat",
                 },
-                "required": ["file_path"],
             },
-        ),
-        # Editing tools
-        Tool(
-            name="update_cell_value",
-            description="Update a single cell's value or formula",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to Excel file",
-                    },
-                    "sheet_name": {
-                        "type": "string",
-                        "description": "Name of worksheet",
-                    },
-                    "cell_ref": {
-                        "type": "string",
-                        "description": "Cell reference (e.g., 'A1')",
-                    },
-                    "value": {
-                        "type": ["string", "number", "boolean", "null"],
-                        "description": "New cell value",
-                    },
-                    "formula": {
-                        "type": "string",
-                        "description": "Formula string (alternative to value)",
-                    },
+            "required": ["file_path"],
+        },
+    ),
+    # Editing tools
+    Tool(
+        name="update_cell_value",
+        description="Update a single cell's value or formula",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to Excel file",
+                },
+                "sheet_name": {
+                    "type": "string",
+                    "description": "Name of worksheet",
+                },
+                "cell_ref": {
+                    "type": "string",
+                    "description": "Cell reference (e.g., 'A1')",
+                },
+                "value": {
+                    "type": ["string", "number", "boolean", "null"],
+                    "description": "New cell value",
+                },
+                "formula": {
+                    "type": "string",
+                    "description": "Formula string (alternative to value)",
                 },
-                "required": ["file_path", "sheet_name", "cell_ref"],
             },
-        ),
-        Tool(
-            name="update_cell_range",
-            description="Update multiple cells in a range",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to Excel file",
-                    },
-                    "sheet_name": {
-                        "type": "string",
-                        "description": "Name of worksheet",
-                    },
-                    "cell_range": {
-                        "type": "string",
-                        "description": "Cell range (e.g., 'A1:C3')",
-                    },
-                    "values": {
+            "required": ["file_path", "sheet_name", "cell_ref"],
+        },
+    ),
+    Tool(
+        name="update_cell_range",
+        description="Update multiple cells in a range",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to Excel file",
+                },
+                "sheet_name": {
+                    "type": "string",
+                    "description": "Name of worksheet",
+                },
+                "cell_range": {
+                    "type": "string",
+                    "description": "Cell range (e.g., 'A1:C3')",
+                },
+                "values": {
+                    "type": "array",
+                    "description": "2D array of values matching range dimensions",
+                    "items": {
                         "type": "array",
-                        "description": "2D array of values matching range dimensions",
-                        "items": {
-                            "type": "array",
-                            "items": {"type": ["string", "number", "boolean", "null"]},
-                        },
+                        "items": {"type": ["string", "number", "boolean", "null"]},
                     },
                 },
-                "required": ["file_path", "sheet_name", "cell_range", "values"],
             },
-        ),
-        # Worksheet management
-        Tool(
-            name="add_worksheet",
-            description="Add a new worksheet to the workbook",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to Excel file",
-                    },
-                    "sheet_name": {
-                        "type": "string",
-                        "description": "Name for new worksheet",
-                    },
-                    "index": {
-                        "type": "integer",
-                        "description": "Position to insert sheet (end if not specified)",
-                    },
+            "required": ["file_path", "sheet_name", "cell_range", "values"],
+        },
+    ),
+    # Worksheet management
+    Tool(
+        name="add_worksheet",
+        description="Add a new worksheet to the workbook",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to Excel file",
+                },
+                "sheet_name": {
+                    "type": "string",
+                    "description": "Name for new worksheet",
+                },
+                "index": {
+                    "type": "integer",
+                    "description": "Position to insert sheet (end if not specified)",
                 },
-                "required": ["file_path", "sheet_name"],
             },
-        ),
-        Tool(
-            name="delete_worksheet",
-            description="Delete a worksheet from the workbook",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to Excel file",
-                    },
-                    "sheet_name": {
-                        "type": "string",
-                        "description": "Name of worksheet to delete",
-                    },
+            "required": ["file_path", "sheet_name"],
+        },
+    ),
+    Tool(
+        name="delete_worksheet",
+        description="Delete a worksheet from the workbook",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to Excel file",
+                },
+                "sheet_name": {
+                    "type": "string",
+                    "description": "Name of worksheet to delete",
                 },
-                "required": ["file_path", "sheet_name"],
             },
-        ),
-        # Export and save
-        Tool(
-            name="export_to_csv",
-            description="Export worksheet data to CSV format",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to Excel file",
-                    },
-                    "sheet_name": {
-                        "type": "string",
-                        "description": "Name of worksheet to export",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Path to save CSV file (optional)",
-                    },
-                    "include_headers": {
-                        "type": "boolean",
-                        "description": "Include first row as headers",
-                        "default": True,
-                    },
+            "required": ["file_path", "sheet_name"],
+        },
+    ),
+    # Export and save
+    Tool(
+        name="export_to_csv",
+        description="Export worksheet data to CSV format",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to Excel file",
+                },
+                "sheet_name": {
+                    "type": "string",
+                    "description": "Name of worksheet to export",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Path to save CSV file (optional)",
+                },
+                "include_headers": {
+                    "type": "boolean",
+                    "description": "Include first row as headers",
+                    "default": True,
                 },
-                "required": ["file_path", "sheet_name"],
             },
-        ),
-        Tool(
-            name="save_workbook",
-            description="Save changes to the workbook",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Current Excel file path",
-                    },
-                    "save_as_path": {
-                        "type": "string",
-                        "description": "New path to save to (optional)",
-                    },
+            "required": ["file_path", "sheet_name"],
+        },
+    ),
+    Tool(
+        name="save_workbook",
+        description="Save changes to the workbook",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Current Excel file path",
+                },
+                "save_as_path": {
+                    "type": "string",
+                    "description": "New path to save to (optional)",
                 },
-                "required": ["file_path"],
             },
-        ),
-    ]
+            "required": ["file_path"],
+        },
+    ),
+]
+
+
+@server.list_resources()
+async def handle_list_resources() -> List[Resource]:
+    """List available resources."""
+    return _RESOURCES
+
+
+@server.read_resource()
+async def handle_read_resource(uri: str) -> str:
+    """Handle resource reading requests."""
+    logger.info("Resource requested: %s", uri)
+
+    if uri == "xlsx://supported-formats":
+        return _SUPPORTED_FORMATS_JSON
+
+    elif uri == "xlsx://server-status":
+        if not _workbook_cache:
+            return _EMPTY_STATUS_JSON
+        key, current = next(reversed(_workbook_cache.items()))
+        try:
+            # Edit handlers mutate the workbook under this lock; wait for them
+            async with _path_lock(key[0]):
+                workbook_info = await _run_io(current.get_workbook_info)
+        except Exception:
+            workbook_info = None
+
+        status = dict(
+            _STATIC_STATUS,
+            workbook_loaded=workbook_info is not None,
+            current_workbook=workbook_info,
+            cached_workbooks=len(_workbook_cache),
+        )
+        return json.dumps(status, indent=2)
+
+    else:
+        raise ValueError(f"Unknown resource URI: {uri}")
+
+
+@server.list_tools()
+async def handle_list_tools() -> List[Tool]:
+    """List available tools."""
+    return _TOOLS
 
 
 @server.call_tool()
@@ -319,30 +556,18 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
     if not isinstance(arguments, dict):
         arguments = {}
 
-    logger.info(
-        "Tool called: %s args=%s", name, json.dumps(arguments, default=str)
-    )
+    # Only argument names at INFO: values can be large 2D arrays, and the
+    # full payload is only encoded when DEBUG logging is actually enabled.
+    logger.info("Tool called: %s args=%s", name, list(arguments))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Tool %s args-json=%s", name, _dumps(arguments))
 
     try:
-        # Route to appropriate handler
-        if name == "read_workbook_info":
-            raw_result = await _read_workbook_info(arguments)
-        elif name == "read_worksheet_data":
-            raw_result = await _read_worksheet_data(arguments)
-        elif name == "update_cell_value":
-            raw_result = await _update_cell_value(arguments)
-        elif name == "update_cell_range":
-            raw_result = await _update_cell_range(arguments)
-        elif name == "add_worksheet":
-            raw_result = await _add_worksheet(arguments)
-        elif name == "delete_worksheet":
-            raw_result = await _delete_worksheet(arguments)
-        elif name == "export_to_csv":
-            raw_result = await _export_to_csv(arguments)
-        elif name == "save_workbook":
-            raw_result = await _save_workbook(arguments)
-        else:
+        handler = _TOOL_DISPATCH.get(name)
+        if handler is None:
             raw_result = user_input_error(f"Unknown tool: {name}")
+        else:
+            raw_result = await handler(arguments)
 
         # Defensive normalization: if a tool accidentally returns a plain list or scalar
         # wrap it in a success envelope so JSON dump is always structured.
@@ -357,9 +582,7 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
         )
 
         # Always serialize tool result as JSON string inside TextContent
-        content = TextContent(
-            type="text", text=json.dumps(raw_result, indent=2, default=str)
-        )
+        content = TextContent(type="text", text=_dumps(raw_result))
         return [content]
 
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -370,15 +593,86 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
             "message": "Tool execution failed",
             "detail": str(e),
         }
-        content = TextContent(
-            type="text", text=json.dumps(error_result, indent=2, default=str)
-        )
+        content = TextContent(type="text", text=_dumps(error_result))
         return [content]
 
 
 # Tool implementation functions
 
 
+def _missing_params(**params: Any) -> List[str]:
+    """Return the names of required parameters that were not supplied.
+
+    Only ``None`` counts as missing, so falsy but valid values such as an
+    empty ``values`` list or a ``0`` are passed through to the processor.
+    """
+    return [name for name, value in params.items() if value is None]
+
+
+def _missing_params_error(missing: List[str]) -> Dict[str, Any]:
+    """Build the UserInput envelope for missing required parameters."""
+    return user_input_error(
+        f"Missing required parameters: {', '.join(missing)}", missing=missing
+    )
+
+
+def _save_with_backup(processor: ExcelProcessor, target: str) -> Dict[str, Any]:
+    """Save ``processor`` to ``target``, backing up a file that is overwritten.
+
+    Edits only touch the in-memory workbook, so this is the one point where
+    the file on disk changes; a single backup here covers every edit made
+    since the last save, and is restored if the save fails part-way.
+    """
+    if not Path(target).is_file():
+        return processor.save_workbook(file_path=target)
+    with FileOperationContext(target, create_backup=True):
+        return processor.save_workbook(file_path=target)
+
+
+def _write_csv_export(
+    processor: ExcelProcessor,
+    sheet_name: str,
+    include_headers: bool,
+    output_path: Optional[str],
+) -> Dict[str, Any]:
+    """Write a worksheet as CSV to ``output_path`` or return it inline."""
+    rows = processor.iter_rows_values(sheet_name=sheet_name)
+    if not include_headers:
+        next(rows, None)
+
+    # Convert to CSV format
+    def write_rows(target: IO[str]) -> int:
+        writer = csv.writer(target)
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    result: Dict[str, Any] = {"sheet_name": sheet_name}
+
+    # Save to file if output_path specified
+    if output_path:
+        with open(
+            output_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=CSV_WRITE_BUFFER_BYTES,
+        ) as f:
+            result["rows_exported"] = write_rows(f)
+        result["csv_data"] = None
+        result["saved_to"] = output_path
+        result["file_size"] = Path(output_path).stat().st_size
+    else:
+        csv_content = io.StringIO()
+        result["rows_exported"] = write_rows(csv_content)
+        result["csv_data"] = csv_content.getvalue()
+        csv_content.close()
+
+    return result
+
+
 async def _read_workbook_info(args: Dict[str, Any]) -> Dict[str, Any]:
     """Read workbook metadata and sheet information."""
     try:
@@ -388,7 +682,18 @@ async def _read_workbook_info(args: Dict[str, Any]) -> Dict[str, Any]:
         if not file_path:
             return user_input_error("Parameter 'file_path' is required")
 
-        workbook_info = excel_processor.load_workbook(file_path, read_only=read_only)
+        async with _path_lock(file_path):
+            path_str = str(validate_excel_file(file_path))
+            stat = Path(path_str).stat()
+            etag = (stat.st_mtime_ns, stat.st_size)
+            cached = _workbook_info_cache.get(path_str)
+            if cached is not None and cached[:2] == etag:
+                return success_response(cached[2])
+
+            processor = await _get_processor(file_path, read_only=read_only)
+            workbook_info = await _run_io(processor.get_workbook_info)
+            _workbook_info_cache[path_str] = (*etag, workbook_info)
+
         return success_response(workbook_info)
 
     except Exception as e:
@@ -402,22 +707,27 @@ async def _read_worksheet_data(args: Dict[str, Any]) -> Dict[str, Any]:
         sheet_name = args.get("sheet_name")
         include_formulas = args.get("include_formulas", False)
         cell_range = args.get("cell_range")
+        shape = args.get("shape", "flat")
 
         if not file_path:
             return user_input_error("Parameter 'file_path' is required")
 
-        # Load workbook if not already loaded or different file
-        if (
-            not excel_processor.is_workbook_loaded()
-            or excel_processor.get_loaded_file_path_str() != file_path
-        ):
-            excel_processor.load_workbook(file_path, read_only=True)
+        if shape not in ("flat", "cells"):
+            return user_input_error("Parameter 'shape' must be 'flat' or 'cells'")
 
-        worksheet_data = excel_processor.get_worksheet_data(
-            sheet_name=sheet_name,
-            include_formulas=include_formulas,
-            cell_range=cell_range,
-        )
+        async with _path_lock(file_path):
+            # Without formulas only cell values are needed, so load the
+            # cached results instead of the formula graph.
+            processor = await _get_processor(
+                file_path, read_only=True, data_only=not include_formulas
+            )
+            worksheet_data = await _run_io(
+                processor.get_worksheet_data,
+                sheet_name=sheet_name,
+                include_formulas=include_formulas,
+                cell_range=cell_range,
+                shape=shape,
+            )
 
         return success_response(worksheet_data)
 
@@ -434,26 +744,25 @@ async def _update_cell_value(args: Dict[str, Any]) -> Dict[str, Any]:
         value = args.get("value")
         formula = args.get("formula")
 
-        if not all([file_path, sheet_name, cell_ref]):
-            return user_input_error(
-                "Parameters 'file_path', 'sheet_name', and 'cell_ref' are required"
-            )
+        missing = _missing_params(
+            file_path=file_path, sheet_name=sheet_name, cell_ref=cell_ref
+        )
+        if missing:
+            return _missing_params_error(missing)
 
         if value is None and formula is None:
             return user_input_error("Either 'value' or 'formula' parameter is required")
 
-        # Use file operation context for safety
-        with FileOperationContext(file_path, create_backup=True):
-            # Load workbook for editing
-            if (
-                not excel_processor.is_workbook_loaded()
-                or excel_processor.get_loaded_file_path_str() != file_path
-            ):
-                excel_processor.load_workbook(file_path, read_only=False)
-
-            result = excel_processor.update_cell_value(
-                sheet_name=sheet_name, cell_ref=cell_ref, value=value, formula=formula
+        async with _path_lock(file_path):
+            processor = await _get_processor(file_path, read_only=False)
+            result = await _run_io(
+                processor.update_cell_value,
+                sheet_name=sheet_name,
+                cell_ref=cell_ref,
+                value=value,
+                formula=formula,
             )
+            _workbook_info_cache.pop(processor.get_loaded_file_path_str(), None)
 
         return success_response(result)
 
@@ -469,24 +778,29 @@ async def _update_cell_range(args: Dict[str, Any]) -> Dict[str, Any]:
         cell_range = args.get("cell_range")
         values = args.get("values")
 
-        if not all([file_path, sheet_name, cell_range, values]):
-            return user_input_error(
-                "Parameters 'file_path', 'sheet_name', 'cell_range', and 'values' are required"
-            )
+        missing = _missing_params(
+            file_path=file_path,
+            sheet_name=sheet_name,
+            cell_range=cell_range,
+            values=values,
+        )
+        if missing:
+            return _missing_params_error(missing)
 
-        if not isinstance(values, list):
+        if not isinstance(values, list) or not all(
+            isinstance(row, list) for row in values
+        ):
             return user_input_error("Parameter 'values' must be a 2D array")
 
-        with FileOperationContext(file_path, create_backup=True):
-            if (
-                not excel_processor.is_workbook_loaded()
-                or excel_processor.get_loaded_file_path_str() != file_path
-            ):
-                excel_processor.load_workbook(file_path, read_only=False)
-
-            result = excel_processor.update_cell_range(
-                sheet_name=sheet_name, cell_range=cell_range, values=values
+        async with _path_lock(file_path):
+            processor = await _get_processor(file_path, read_only=False)
+            result = await _run_io(
+                processor.update_cell_range,
+                sheet_name=sheet_name,
+                cell_range=cell_range,
+                values=values,
             )
+            _workbook_info_cache.pop(processor.get_loaded_file_path_str(), None)
 
         return success_response(result)
 
@@ -501,19 +815,18 @@ async def _add_worksheet(args: Dict[str, Any]) -> Dict[str, Any]:
         sheet_name = args.get("sheet_name")
         index = args.get("index")
 
-        if not all([file_path, sheet_name]):
-            return user_input_error(
-                "Parameters 'file_path' and 'sheet_name' are required"
-            )
-
-        with FileOperationContext(file_path, create_backup=True):
-            if (
-                not excel_processor.is_workbook_loaded()
-                or excel_processor.get_loaded_file_path_str() != file_path
-            ):
-                excel_processor.load_workbook(file_path, read_only=False)
+        missing = _missing_params(file_path=file_path, sheet_name=sheet_name)
+        if missing:
+            return _missing_params_error(missing)
 
-            result = excel_processor.add_worksheet(sheet_name=sheet_name, index=index)
+        async with _path_lock(file_path):
+            processor = await _get_processor(file_path, read_only=False)
+            result = await _run_io(
+                processor.add_worksheet,
+                sheet_name=sheet_name,
+                index=index,
+            )
+            _workbook_info_cache.pop(processor.get_loaded_file_path_str(), None)
 
         return success_response(result)
 
@@ -527,19 +840,17 @@ async def _delete_worksheet(args: Dict[str, Any]) -> Dict[str, Any]:
         file_path = args.get("file_path")
         sheet_name = args.get("sheet_name")
 
-        if not all([file_path, sheet_name]):
-            return user_input_error(
-                "Parameters 'file_path' and 'sheet_name' are required"
-            )
-
-        with FileOperationContext(file_path, create_backup=True):
-            if (
-                not excel_processor.is_workbook_loaded()
-                or excel_processor.get_loaded_file_path_str() != file_path
-            ):
-                excel_processor.load_workbook(file_path, read_only=False)
+        missing = _missing_params(file_path=file_path, sheet_name=sheet_name)
+        if missing:
+            return _missing_params_error(missing)
 
-            result = excel_processor.delete_worksheet(sheet_name=sheet_name)
+        async with _path_lock(file_path):
+            processor = await _get_processor(file_path, read_only=False)
+            result = await _run_io(
+                processor.delete_worksheet,
+                sheet_name=sheet_name,
+            )
+            _workbook_info_cache.pop(processor.get_loaded_file_path_str(), None)
 
         return success_response(result)
 
@@ -555,51 +866,15 @@ async def _export_to_csv(args: Dict[str, Any]) -> Dict[str, Any]:
         output_path = args.get("output_path")
         include_headers = args.get("include_headers", True)
 
-        if not all([file_path, sheet_name]):
-            return user_input_error(
-                "Parameters 'file_path' and 'sheet_name' are required"
-            )
-
-        # Load workbook if needed
-        if (
-            not excel_processor.is_workbook_loaded()
-            or excel_processor.get_loaded_file_path_str() != file_path
-        ):
-            excel_processor.load_workbook(file_path, read_only=True)
-
-        # Get worksheet data
-        worksheet_data = excel_processor.get_worksheet_data(sheet_name=sheet_name)
-
-        # Convert to CSV format
-        import csv
-        import io
+        missing = _missing_params(file_path=file_path, sheet_name=sheet_name)
+        if missing:
+            return _missing_params_error(missing)
 
-        csv_content = io.StringIO()
-        writer = csv.writer(csv_content)
-
-        rows = worksheet_data["data"]
-        if not include_headers and rows:
-            rows = rows[1:]
-
-        for row_data in rows:
-            row_values = [cell["value"] for cell in row_data]
-            writer.writerow(row_values)
-
-        csv_string = csv_content.getvalue()
-        csv_content.close()
-
-        result = {
-            "sheet_name": sheet_name,
-            "rows_exported": len(rows),
-            "csv_data": csv_string if not output_path else None,
-        }
-
-        # Save to file if output_path specified
-        if output_path:
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                f.write(csv_string)
-            result["saved_to"] = output_path
-            result["file_size"] = len(csv_string.encode("utf-8"))
+        async with _path_lock(file_path):
+            processor = await _get_processor(file_path, read_only=True)
+            result = await _run_io(
+                _write_csv_export, processor, sheet_name, include_headers, output_path
+            )
 
         return success_response(result)
 
@@ -616,24 +891,48 @@ async def _save_workbook(args: Dict[str, Any]) -> Dict[str, Any]:
         if not file_path:
             return user_input_error("Parameter 'file_path' is required")
 
-        if not excel_processor.is_workbook_loaded():
-            return user_input_error("No workbook is currently loaded")
+        async with _path_lock(file_path):
+            cached = _find_editable_processor(file_path)
+            if cached is None:
+                return user_input_error("No workbook is currently loaded")
+
+            key, processor = cached
+            result = await _run_io(
+                _save_with_backup, processor, save_as_path or file_path
+            )
+
+            # Saving in place bumps the file's mtime; re-key so the next call
+            # keeps using this processor instead of re-parsing the file.
+            if not save_as_path or Path(save_as_path).resolve() == Path(key[0]):
+                del _workbook_cache[key]
+                new_key = (key[0], Path(key[0]).stat().st_mtime_ns, False, False)
+                _workbook_cache[new_key] = processor
 
-        result = excel_processor.save_workbook(file_path=save_as_path or file_path)
         return success_response(result)
 
     except Exception as e:
         return internal_error("Failed to save workbook", detail=str(e))
 
 
+# Tool name -> implementation, consulted by handle_call_tool.
+_TOOL_DISPATCH: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+    "read_workbook_info": _read_workbook_info,
+    "read_worksheet_data": _read_worksheet_data,
+    "update_cell_value": _update_cell_value,
+    "update_cell_range": _update_cell_range,
+    "add_worksheet": _add_worksheet,
+    "delete_worksheet": _delete_worksheet,
+    "export_to_csv": _export_to_csv,
+    "save_workbook": _save_workbook,
+}
+
+
 async def run() -> None:
     """Run the MCP server."""
     logger.info("Starting Excel Reader MCP server")
 
     try:
         # Run server with stdio transport
-        from mcp.server.stdio import stdio_server
-
         async with stdio_server() as (read_stream, write_stream):
             await server.run(
                 read_stream, write_stream, server.create_initialization_options()
@@ -644,5 +943,5 @@ async def run() -> None:
         raise
     finally:
         # Cleanup
-        excel_processor.close_workbook()
+        _close_cached_workbooks()
         logger.info("Excel Reader MCP server stopped")
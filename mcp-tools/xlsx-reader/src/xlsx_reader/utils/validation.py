@@ -7,6 +7,9 @@ from typing import Any, Dict, List, Optional, Set
 
 from ..errors import ValidationError
 
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off"})
+
 
 def validate_required_params(params: Dict[str, Any], required: Set[str]) -> None:
     """Validate that all required parameters are present.
@@ -172,9 +175,9 @@ def validate_bool_param(
     # Try to convert string representations
     if isinstance(value, str):
         lower_value = value.lower()
-        if lower_value in ("true", "1", "yes", "on"):
+        if lower_value in _TRUE_STRINGS:
             return True
-        elif lower_value in ("false", "0", "no", "off"):
+        elif lower_value in _FALSE_STRINGS:
             return False
 
     raise ValidationError(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -17,36 +18,70 @@ from xlsx_reader.safety import FileOperationContext, cleanup_backup, restore_bac
 from xlsx_reader.utils.validation import validate_bool_param
 
 
-def _create_workbook(path: Path) -> None:
+def _build_workbook() -> bytes:
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "Sales"
 
-    ws["A1"].value = "Name"
-    ws["B1"].value = "Qty"
-    ws["C1"].value = "Note"
-
-    ws["A2"].value = "Widget"
-    ws["B2"].value = 2
-    ws["C2"].value = None
+    ws.append(["Name", "Qty", "Note"])
+    ws.append(["Widget", 2, None])
 
     # Some formatting + formula coverage
-    ws["A1"].font = Font(bold=True)
-    ws["A1"].alignment = Alignment(wrap_text=True)
-    ws["A1"].fill = PatternFill(patternType="solid", fgColor="FF0000")
-    ws["B3"].value = "=SUM(B2:B2)"
+    header = ws.cell(row=1, column=1)
+    header.font = Font(bold=True)
+    header.alignment = Alignment(wrap_text=True)
+    header.fill = PatternFill(patternType="solid", fgColor="FF0000")
+    ws.cell(row=3, column=2, value="=SUM(B2:B2)")
 
     wb.create_sheet("Other")
 
-    wb.save(path)
+    buf = io.BytesIO()
+    wb.save(buf)
     wb.close()
+    return buf.getvalue()
+
+
+# Built once per test session; each test gets its own copy on disk.
+_WORKBOOK_BYTES = _build_workbook()
+
+
+def _create_workbook(path: Path) -> None:
+    path.write_bytes(_WORKBOOK_BYTES)
+
+
+@pytest.fixture
+def xlsx(tmp_path: Path) -> Path:
+    """A fresh copy of the sample workbook in the test's tmp_path."""
+    path = tmp_path / "book.xlsx"
+    _create_workbook(path)
+    return path
+
 
+def _boom(*_a, **_k):
+    raise RuntimeError("boom")
 
-def test_chart_processor_more_branches(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
 
-    wb = openpyxl.load_workbook(xlsx, read_only=False, data_only=False)
+def _patch_instance(monkeypatch, obj, **attrs) -> None:
+    """Override ``attrs`` on ``obj`` alone through a throwaway subclass.
+
+    Dunder methods and properties are looked up on the type, so they cannot be
+    set on the instance itself; swapping ``__class__`` keeps every other
+    worksheet or workbook unpatched. ``monkeypatch`` restores the class.
+    """
+    patched = type(f"Patched{type(obj).__name__}", (type(obj),), attrs)
+    monkeypatch.setattr(obj, "__class__", patched)
+
+
+@pytest.fixture(scope="module")
+def shared_workbook():
+    """One loaded sample workbook for tests that never modify it."""
+    wb = openpyxl.load_workbook(io.BytesIO(_WORKBOOK_BYTES))
+    yield wb
+    wb.close()
+
+
+def test_chart_processor_more_branches(xlsx: Path, monkeypatch):
+    wb = openpyxl.load_workbook(xlsx, data_only=True)
     charts = ChartProcessor(wb)
 
     created = charts.create_chart(
@@ -87,21 +122,15 @@ def test_chart_processor_more_branches(tmp_path: Path, monkeypatch):
     assert deleted["deleted"] is True
 
     # extract_all_charts exception path for a sheet
-    def boom(_sheet_name: str):
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(charts, "extract_charts_from_sheet", boom)
+    monkeypatch.setattr(charts, "extract_charts_from_sheet", _boom)
     all_charts = charts.extract_all_charts()
     assert any(isinstance(v, dict) and "error" in v for v in all_charts.values())
 
     wb.close()
 
 
-def test_chart_helper_exception_fallbacks(tmp_path: Path):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-    wb = openpyxl.load_workbook(xlsx, read_only=False, data_only=False)
-    charts = ChartProcessor(wb)
+def test_chart_helper_exception_fallbacks(shared_workbook):
+    charts = ChartProcessor(shared_workbook)
 
     class BadAnchor:
         @property
@@ -135,27 +164,22 @@ def test_chart_helper_exception_fallbacks(tmp_path: Path):
     assert charts._extract_chart_series(BadChart()) == []
     assert charts._get_chart_style(BadChart()) == {}
 
-    wb.close()
-
 
-def test_chart_processor_unsupported_type(tmp_path: Path):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-    wb = openpyxl.load_workbook(xlsx, read_only=False, data_only=False)
-    charts = ChartProcessor(wb)
+def test_chart_processor_unsupported_type(shared_workbook):
+    charts = ChartProcessor(shared_workbook)
     with pytest.raises(ChartError):
         charts.create_chart("Sales", "nope", "Sales!A1:B2")
-    wb.close()
+    assert shared_workbook["Sales"]._charts == []
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakeCache:
     worksheetSource: str = "A1:B2"
     recordCount: int = 2
     refreshOnLoad: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakeLocation:
     ref: str = "A1"
     firstHeaderRow: int = 1
@@ -163,7 +187,7 @@ class _FakeLocation:
     firstDataCol: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakeField:
     name: str | None = None
     axis: str | None = None
@@ -172,7 +196,7 @@ class _FakeField:
     x: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakeStyle:
     name: str = "PivotStyle"
     showRowHeaders: bool = True
@@ -181,7 +205,7 @@ class _FakeStyle:
     showColStripes: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakePivot:
     name: str = "PT1"
     cache: _FakeCache | None = None
@@ -194,26 +218,25 @@ class _FakePivot:
     pivotTableStyleInfo: _FakeStyle | None = None
 
 
-def test_pivot_processor_more_branches(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
+# Only read (extract/summary), never modified, so one instance is shared.
+_RICH_PIVOT = _FakePivot(
+    cache=_FakeCache(),
+    location=_FakeLocation(),
+    pivotFields=[_FakeField(name="F1", axis="row", items=[1])],
+    dataFields=[_FakeField(name="DF1", axis=None)],
+    rowFields=[_FakeField(x=1)],
+    colFields=[_FakeField(x=2)],
+    pageFields=[_FakeField(x=3)],
+    pivotTableStyleInfo=_FakeStyle(),
+)
+
 
-    wb = openpyxl.load_workbook(xlsx, read_only=False, data_only=False)
+def test_pivot_processor_more_branches(xlsx: Path, monkeypatch):
+    wb = openpyxl.load_workbook(xlsx, data_only=True)
     sheet = wb["Sales"]
 
     # Inject richer pivot
-    sheet._pivots = [
-        _FakePivot(
-            cache=_FakeCache(),
-            location=_FakeLocation(),
-            pivotFields=[_FakeField(name="F1", axis="row", items=[1])],
-            dataFields=[_FakeField(name="DF1", axis=None)],
-            rowFields=[_FakeField(x=1)],
-            colFields=[_FakeField(x=2)],
-            pageFields=[_FakeField(x=3)],
-            pivotTableStyleInfo=_FakeStyle(),
-        )
-    ]  # type: ignore[attr-defined]
+    sheet._pivots = [_RICH_PIVOT]  # type: ignore[attr-defined]
 
     piv = PivotTableProcessor(wb)
 
@@ -224,10 +247,7 @@ def test_pivot_processor_more_branches(tmp_path: Path, monkeypatch):
     assert summary["field_count"] >= 1
 
     # extract_all_pivot_tables error dict branch
-    def boom(_sheet_name: str):
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(piv, "extract_pivot_tables_from_sheet", boom)
+    monkeypatch.setattr(piv, "extract_pivot_tables_from_sheet", _boom)
     all_pivots = piv.extract_all_pivot_tables()
     assert any(isinstance(v, dict) and "error" in v for v in all_pivots.values())
 
@@ -243,10 +263,8 @@ def test_pivot_processor_more_branches(tmp_path: Path, monkeypatch):
     wb.close()
 
 
-def test_pivot_processor_more_errors_and_helpers(tmp_path: Path):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-    wb = openpyxl.load_workbook(xlsx, read_only=False, data_only=False)
+def test_pivot_processor_more_errors_and_helpers(xlsx: Path):
+    wb = openpyxl.load_workbook(xlsx, data_only=True)
     sheet = wb["Sales"]
     piv = PivotTableProcessor(wb)
 
@@ -284,60 +302,127 @@ def test_pivot_processor_more_errors_and_helpers(tmp_path: Path):
     assert "column_fields" in created["fields_config"]
     assert "data_fields" in created["fields_config"]
 
-    # Helper exception fallbacks
-    class BadPivot:
-        @property
-        def cache(self):
-            raise RuntimeError("boom")
+    wb.close()
 
-        @property
-        def location(self):
-            raise RuntimeError("boom")
 
-        @property
-        def pivotFields(self):
-            raise RuntimeError("boom")
+class _BadPivot:
+    """Pivot stand-in whose every attribute read fails."""
 
-        @property
-        def dataFields(self):
-            raise RuntimeError("boom")
+    def __getattr__(self, name):
+        raise RuntimeError("boom")
 
-        @property
-        def rowFields(self):
-            raise RuntimeError("boom")
 
-        @property
-        def colFields(self):
-            raise RuntimeError("boom")
+@pytest.mark.parametrize(
+    ("helper", "expected"),
+    [
+        ("_get_cache_definition", {}),
+        ("_get_pivot_location", {}),
+        ("_extract_pivot_fields", []),
+        ("_extract_data_fields", []),
+        ("_extract_row_fields", []),
+        ("_extract_column_fields", []),
+        ("_extract_filter_fields", []),
+        ("_get_pivot_style", {}),
+    ],
+)
+def test_pivot_helper_exception_fallbacks(shared_workbook, helper, expected):
+    piv = PivotTableProcessor(shared_workbook)
+    assert getattr(piv, helper)(_BadPivot()) == expected
+
+
+def test_pivot_processor_iter_all_pivot_tables(xlsx: Path, monkeypatch):
+    wb = openpyxl.load_workbook(xlsx, data_only=True)
+    wb["Sales"]._pivots = [_FakePivot(name="A"), _FakePivot(name="B")]  # type: ignore[attr-defined]
+    piv = PivotTableProcessor(wb)
 
-        @property
-        def pageFields(self):
-            raise RuntimeError("boom")
+    streamed = list(piv.iter_all_pivot_tables())
+    assert [(s, p["name"]) for s, p in streamed] == [("Sales", "A"), ("Sales", "B")]
 
-        @property
-        def pivotTableStyleInfo(self):
-            raise RuntimeError("boom")
+    monkeypatch.setattr(piv, "extract_pivot_tables_from_sheet", _boom)
+    streamed = list(piv.iter_all_pivot_tables())
+    assert streamed == [("Sales", {"error": "boom"}), ("Other", {"error": "boom"})]
+
+    wb.close()
+
+
+def test_pivot_processor_batch_delete(xlsx: Path):
+    wb = openpyxl.load_workbook(xlsx, data_only=True)
+    sheet = wb["Sales"]
+    piv = PivotTableProcessor(wb)
+
+    sheet._pivots = [_FakePivot(name=f"PT{i}") for i in range(4)]  # type: ignore[attr-defined]
+    result = piv.delete_pivot_tables("Sales", [0, 2, 2])
+    assert result["deleted"] == [2, 0]
+    assert result["failed"] == []
+    assert result["remaining_pivots"] == 2
+    assert [p.name for p in sheet._pivots] == ["PT1", "PT3"]
+
+    # Any invalid index rejects the whole batch before anything is removed
+    with pytest.raises(PivotTableError):
+        piv.delete_pivot_tables("Sales", [0, 5])
+    with pytest.raises(PivotTableError):
+        piv.delete_pivot_tables("Sales", [-3])
+    assert len(sheet._pivots) == 2
+
+    # Negative indices count from the end, and alias their positive form
+    result = piv.delete_pivot_tables("Sales", [-1, 1])
+    assert result["deleted"] == [1]
+    assert [p.name for p in sheet._pivots] == ["PT1"]
+    assert piv.delete_pivot_table("Sales", -1)["deleted"] is True
+    assert sheet._pivots == []
 
-    assert piv._get_cache_definition(BadPivot()) == {}
-    assert piv._get_pivot_location(BadPivot()) == {}
-    assert piv._extract_pivot_fields(BadPivot()) == []
-    assert piv._extract_data_fields(BadPivot()) == []
-    assert piv._extract_row_fields(BadPivot()) == []
-    assert piv._extract_column_fields(BadPivot()) == []
-    assert piv._extract_filter_fields(BadPivot()) == []
-    assert piv._get_pivot_style(BadPivot()) == {}
+    with pytest.raises(PivotTableError):
+        piv.delete_pivot_tables("Missing", [0])
 
     wb.close()
 
 
-def test_workbook_processor_more_branches(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
+def test_pivot_processor_from_path_and_read_only_gate(xlsx: Path, tmp_path: Path):
+    piv = PivotTableProcessor.from_path(str(xlsx))
+    assert piv.workbook.read_only is False
+    assert piv.extract_all_pivot_tables() == {}
+    piv.workbook.close()
+
+    ro = PivotTableProcessor.from_path(str(xlsx), read_only=True)
+    assert ro.workbook.read_only is True
+    with pytest.raises(PivotTableError, match="read-only"):
+        ro.create_pivot_table("Sales", "A1:B2", "Sales", "A10", {})
+    with pytest.raises(PivotTableError, match="read-only"):
+        ro.modify_pivot_table("Sales", 0, {})
+    with pytest.raises(PivotTableError, match="read-only"):
+        ro.delete_pivot_table("Sales", 0)
+    ro.workbook.close()
 
+    with pytest.raises(PivotTableError):
+        PivotTableProcessor.from_path(str(tmp_path / "missing.xlsx"))
+
+
+def test_pivot_processor_mutations_keep_formulas(tmp_path: Path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Sales"
+    ws.append([1, 2, "=A1+B1"])
+    path = tmp_path / "formulas.xlsx"
+    wb.save(path)
+    wb.close()
+
+    # An editable load keeps formulas, so saving after a change preserves them
+    piv = PivotTableProcessor.from_path(str(path))
+    assert piv.workbook.data_only is False
+    piv.workbook["Sales"]._pivots = [_FakePivot()]  # type: ignore[attr-defined]
+    assert piv.delete_pivot_table("Sales", 0)["deleted"] is True
+    piv.workbook.save(path)
+    piv.workbook.close()
+    reloaded = openpyxl.load_workbook(path)
+    assert reloaded["Sales"]["C1"].value == "=A1+B1"
+    reloaded.close()
+
+
+def test_workbook_processor_more_branches(xlsx: Path, tmp_path: Path, monkeypatch):
     proc = ExcelProcessor()
 
     # load_workbook error
-    monkeypatch.setattr(openpyxl, "load_workbook", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("boom")))
+    monkeypatch.setattr(openpyxl, "load_workbook", _boom)
     with pytest.raises(Exception):
         proc.load_workbook(str(xlsx), read_only=False)
 
@@ -369,10 +454,7 @@ def test_workbook_processor_more_branches(tmp_path: Path, monkeypatch):
     proc.close_workbook()
 
 
-def test_workbook_processor_formatting_and_save_paths(tmp_path: Path):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-
+def test_workbook_processor_formatting_and_save_paths(xlsx: Path):
     proc = ExcelProcessor()
     proc.load_workbook(str(xlsx), read_only=False)
 
@@ -382,14 +464,9 @@ def test_workbook_processor_formatting_and_save_paths(tmp_path: Path):
     # Active sheet branch + include_formulas path + formatting serialization
     data = proc.get_worksheet_data(sheet_name=None, include_formulas=True)
     assert data["sheet_name"]
-    assert any(
-        any("font" in c or "fill" in c or "alignment" in c for c in row)
-        for row in data["data"]
-    )
-    assert any(
-        any(c.get("formula") for c in row if c.get("data_type") == "f")
-        for row in data["data"]
-    )
+    cells = [c for row in data["data"] for c in row]
+    assert any("font" in c or "fill" in c or "alignment" in c for c in cells)
+    assert any(c.get("formula") for c in cells if c.get("data_type") == "f")
 
     # update_cell_value formula branch
     updated = proc.update_cell_value("Sales", "C3", value=None, formula="1+1")
@@ -409,35 +486,31 @@ def test_workbook_processor_formatting_and_save_paths(tmp_path: Path):
     proc.close_workbook()
 
 
-def test_workbook_processor_remaining_branches(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-
+def test_workbook_processor_remaining_branches(xlsx: Path, monkeypatch):
     proc = ExcelProcessor()
     proc.load_workbook(str(xlsx), read_only=False)
 
-    # get_workbook_info: force dimensions else-branch
-    monkeypatch.setattr(OpenpyxlWorksheet, "max_row", property(lambda _self: 0), raising=False)
-    monkeypatch.setattr(OpenpyxlWorksheet, "max_column", property(lambda _self: 0), raising=False)
+    # get_workbook_info: force dimensions else-branch (bounds cached by load)
+    _patch_instance(
+        monkeypatch,
+        proc._workbook["Sales"],
+        max_row=property(lambda _self: 0),
+        max_column=property(lambda _self: 0),
+    )
+    proc._bounds_cache.clear()
     info = proc.get_workbook_info()
-    assert any(s.get("dimensions") == "A1:A1" for s in info.get("sheets", []))
+    assert info["sheets"][0]["max_row"] == 0
+    assert info["sheets"][0]["dimensions"] == "A1:A1"
 
     # get_workbook_info exception handler
-    from openpyxl.workbook.workbook import Workbook as OpenpyxlWorkbook
-
-    def boom_getitem(self, _key):
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(OpenpyxlWorkbook, "__getitem__", boom_getitem)
+    _patch_instance(monkeypatch, proc._workbook, worksheets=property(_boom))
     with pytest.raises(WorkbookError):
         proc.get_workbook_info()
 
-    # Restore monkeypatches before loading a new workbook instance.
+    # The patches only touched this workbook's objects; undo them and drop
+    # the bounds cached while max_row/max_column were forced to 0.
     monkeypatch.undo()
-
-    # Restore workbook for worksheet-data tests
-    proc2 = ExcelProcessor()
-    proc2.load_workbook(str(xlsx), read_only=False)
+    proc._bounds_cache.clear()
 
     # get_worksheet_data: cells=[] branch by forcing an empty read for the computed range
     orig_getitem = OpenpyxlWorksheet.__getitem__
@@ -447,13 +520,13 @@ def test_workbook_processor_remaining_branches(tmp_path: Path, monkeypatch):
             return []
         return orig_getitem(self, key)
 
-    monkeypatch.setattr(OpenpyxlWorksheet, "__getitem__", empty_range_getitem)
-    data = proc2.get_worksheet_data(sheet_name="Sales", include_formulas=False, cell_range=None)
+    _patch_instance(monkeypatch, proc._workbook["Sales"], __getitem__=empty_range_getitem)
+    data = proc.get_worksheet_data(sheet_name="Sales", include_formulas=False, cell_range=None)
     assert data["rows"] == 0
 
     # get_worksheet_data: single-row coercion branch + update_cell_range branches
     monkeypatch.undo()
-    one_row = proc2.get_worksheet_data(sheet_name="Sales", cell_range="A1:C1")
+    one_row = proc.get_worksheet_data(sheet_name="Sales", cell_range="A1:C1")
     assert one_row["rows"] == 1
 
     # update_cell_value/update_cell_range: no-workbook-loaded branches
@@ -464,16 +537,16 @@ def test_workbook_processor_remaining_branches(tmp_path: Path, monkeypatch):
 
     # update_cell_range: sheet not found
     with pytest.raises(WorksheetError):
-        proc2.update_cell_range("Missing", "A1", [[1]])
+        proc.update_cell_range("Missing", "A1", [[1]])
 
     # update_cell_range: single-cell + single-row coercions + early row break
-    proc2.update_cell_range("Sales", "A1", [["Z"]])
-    proc2.update_cell_range("Sales", "A1:C1", [["a", "b", "c"]])
-    proc2.update_cell_range("Sales", "A1:C2", [["r1", "r1", "r1"]])
+    proc.update_cell_range("Sales", "A1", [["Z"]])
+    proc.update_cell_range("Sales", "A1:C1", [["a", "b", "c"]])
+    proc.update_cell_range("Sales", "A1:C2", [["r1", "r1", "r1"]])
 
     # update_cell_range exception handler
     with pytest.raises(WorksheetError):
-        proc2.update_cell_range("Sales", "A1:B2:C3", [[1]])
+        proc.update_cell_range("Sales", "A1:B2:C3", [[1]])
 
     # add/delete/close: no-workbook-loaded branches
     with pytest.raises(WorksheetError):
@@ -489,12 +562,10 @@ def test_workbook_processor_remaining_branches(tmp_path: Path, monkeypatch):
     with pytest.raises(WorksheetError):
         proc_single.delete_worksheet(wb_single.active.title)
 
-    proc2.close_workbook()
+    proc.close_workbook()
 
 
-def test_workbook_get_worksheet_data_skip_emptycell_and_formula_attr(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
+def test_workbook_get_worksheet_data_skip_emptycell_and_formula_attr(xlsx: Path, monkeypatch):
     proc = ExcelProcessor()
     proc.load_workbook(str(xlsx), read_only=False)
 
@@ -527,7 +598,7 @@ def test_workbook_get_worksheet_data_skip_emptycell_and_formula_attr(tmp_path: P
             return [[fake_cell]]
         return orig_getitem(self, key)
 
-    monkeypatch.setattr(OpenpyxlWorksheet, "__getitem__", patched_getitem)
+    _patch_instance(monkeypatch, proc._workbook["Sales"], __getitem__=patched_getitem)
 
     skipped = proc.get_worksheet_data("Sales", cell_range="A1")
     assert skipped["rows"] == 1
@@ -540,10 +611,7 @@ def test_workbook_get_worksheet_data_skip_emptycell_and_formula_attr(tmp_path: P
     proc.close_workbook()
 
 
-def test_safety_remaining_branches(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-
+def test_safety_remaining_branches(xlsx: Path, tmp_path: Path, monkeypatch):
     # restore_backup: backup_path defaulting line
     backup_path = xlsx.with_suffix(xlsx.suffix + ".backup")
     backup_path.write_bytes(xlsx.read_bytes())
@@ -559,7 +627,7 @@ def test_safety_remaining_branches(tmp_path: Path, monkeypatch):
     # FileOperationContext: __enter__ exception path + cleanup
     from xlsx_reader import safety as safety_mod
 
-    monkeypatch.setattr(safety_mod.FileLock, "acquire", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("boom")))
+    monkeypatch.setattr(safety_mod.FileLock, "acquire", _boom)
     monkeypatch.setattr(safety_mod.FileLock, "release", lambda *_a, **_k: None)
     with pytest.raises(Exception):
         with FileOperationContext(str(xlsx), create_backup=False):
@@ -585,10 +653,8 @@ def test_safety_remaining_branches(tmp_path: Path, monkeypatch):
         validate_cell_reference(":A1")
 
 
-def test_charts_pivots_exporters_remaining_branches(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-    wb = openpyxl.load_workbook(xlsx, read_only=False, data_only=False)
+def test_charts_pivots_exporters_remaining_branches(xlsx: Path, monkeypatch):
+    wb = openpyxl.load_workbook(xlsx, data_only=True)
     charts = ChartProcessor(wb)
     pivots = PivotTableProcessor(wb)
 
@@ -653,11 +719,11 @@ def test_charts_pivots_exporters_remaining_branches(tmp_path: Path, monkeypatch)
     proc.load_workbook(str(xlsx), read_only=False)
     exporter = DataExporter(proc)
 
-    monkeypatch.setattr(proc, "get_worksheet_data", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("boom")))
+    monkeypatch.setattr(proc, "iter_rows_values", _boom)
     with pytest.raises(WorksheetError):
         exporter.export_worksheet_to_csv("Sales")
 
-    monkeypatch.setattr(proc, "get_workbook_info", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("boom")))
+    monkeypatch.setattr(proc, "get_workbook_info", _boom)
     with pytest.raises(WorksheetError):
         exporter.export_workbook_to_json()
 
@@ -677,12 +743,9 @@ def test_validation_bool_direct_path():
     assert validate_bool_param(True, "flag") is True
 
 
-def test_exporters_and_safety_more_branches(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-
+def test_exporters_and_safety_more_branches(xlsx: Path, tmp_path: Path, monkeypatch):
     proc = ExcelProcessor()
-    proc.load_workbook(str(xlsx), read_only=False)
+    proc.load_workbook(str(xlsx), read_only=True)
 
     exporter = DataExporter(proc)
 
@@ -697,15 +760,12 @@ def test_exporters_and_safety_more_branches(tmp_path: Path, monkeypatch):
     assert Path(json_res["saved_to"]).exists()
 
     # pandas exception branch
-    def boom(*_a, **_k):
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(proc, "get_worksheet_data", boom)
+    monkeypatch.setattr(proc, "get_worksheet_data", _boom)
     with pytest.raises(WorksheetError):
         exporter.export_sheet_to_pandas("Sales")
 
     # stats exception branch
-    monkeypatch.setattr(exporter, "export_sheet_to_pandas", boom)
+    monkeypatch.setattr(exporter, "export_sheet_to_pandas", _boom)
     with pytest.raises(WorksheetError):
         exporter.get_summary_statistics("Sales")
 
@@ -717,7 +777,7 @@ def test_exporters_and_safety_more_branches(tmp_path: Path, monkeypatch):
     # Safety: cleanup_backup warning branch
     backup_path = xlsx.with_suffix(xlsx.suffix + ".backup")
     backup_path.write_text("x")
-    monkeypatch.setattr(type(backup_path), "unlink", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("no")))
+    monkeypatch.setattr(type(backup_path), "unlink", _boom)
     cleanup_backup(backup_path)
 
     proc.close_workbook()
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import datetime
+import io
 import json
+import os
 import shutil
+import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import openpyxl
 import pytest
@@ -22,24 +27,38 @@ from xlsx_reader.processors.workbook import ExcelProcessor
 from xlsx_reader.utils import validation as v
 
 
-def _create_workbook(path: Path, with_data: bool = True) -> None:
+def _build_workbook() -> bytes:
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "Sales"
     wb.create_sheet("Empty")
 
-    if with_data:
-        ws["A1"].value = "Product"
-        ws["B1"].value = "Qty"
-        ws["C1"].value = "Price"
-        ws["D1"].value = "Total"
+    ws.append(["Product", "Qty", "Price", "Total"])
+    ws.append(["Widget", 2, 3, "=B2*C2"])
 
-        ws["A2"].value = "Widget"
-        ws["B2"].value = 2
-        ws["C2"].value = 3
-        ws["D2"].value = "=B2*C2"
+    buf = io.BytesIO()
+    wb.save(buf)
+    wb.close()
+    return buf.getvalue()
+
+
+# Built once per test session; each test gets its own copy on disk.
+_WORKBOOK_BYTES = _build_workbook()
+
+
+@pytest.fixture
+def xlsx(tmp_path: Path) -> Path:
+    """A fresh copy of the sample workbook in the test's tmp_path."""
+    path = tmp_path / "book.xlsx"
+    path.write_bytes(_WORKBOOK_BYTES)
+    return path
 
-    wb.save(path)
+
+@pytest.fixture(scope="module")
+def shared_workbook():
+    """One loaded sample workbook for tests that never modify it."""
+    wb = openpyxl.load_workbook(io.BytesIO(_WORKBOOK_BYTES), data_only=True)
+    yield wb
     wb.close()
 
 
@@ -130,7 +149,7 @@ def test_validation_more_branches():
         v.validate_dict_param({"a": 1, "x": 2}, "d", allowed_keys={"a"})
 
 
-def test_safety_more_branches(tmp_path: Path, monkeypatch):
+def test_safety_more_branches(xlsx: Path, tmp_path: Path):
     # validate_file_path bad inputs
     with pytest.raises(ValidationError):
         safety.validate_file_path("")
@@ -139,12 +158,9 @@ def test_safety_more_branches(tmp_path: Path, monkeypatch):
         def resolve(self):
             raise RuntimeError("boom")
 
-    monkeypatch.setattr(safety, "Path", lambda _p: BadPath())
-    with pytest.raises(ValidationError):
-        safety.validate_file_path("/nope")
-
-    # restore Path
-    monkeypatch.setattr(safety, "Path", Path)
+    with patch.object(safety, "Path", lambda _p: BadPath()):
+        with pytest.raises(ValidationError):
+            safety.validate_file_path("/nope")
 
     # missing
     with pytest.raises(errors.FileAccessError):
@@ -162,40 +178,71 @@ def test_safety_more_branches(tmp_path: Path, monkeypatch):
     with pytest.raises(ValidationError):
         safety.validate_excel_file(str(bad))
 
+    legacy = tmp_path / "old.xls"
+    legacy.write_bytes(b"x")
+    with pytest.raises(ValidationError, match="Supported: .xlsm, .xlsx, .xltm, .xltx"):
+        safety.validate_excel_file(str(legacy))
+
+    for ext in (".xlsx", ".XLSM", ".xltx", ".xltm"):
+        ok = tmp_path / f"ok{ext}"
+        ok.write_bytes(b"x")
+        assert safety.validate_excel_file(str(ok)) == ok.resolve()
+
     # validate_file_size too large and stat error
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
 
     class FakeStat:
         st_size = safety.MAX_FILE_SIZE_BYTES + 1
 
-    monkeypatch.setattr(Path, "stat", lambda self: FakeStat())
-    with pytest.raises(ValidationError):
-        safety.validate_file_size(xlsx)
-
-    def boom_stat(self):
-        raise OSError("no")
-
-    monkeypatch.setattr(Path, "stat", boom_stat)
-    with pytest.raises(errors.FileAccessError):
-        safety.validate_file_size(xlsx)
+    with patch.object(Path, "stat", lambda *_a, **_k: FakeStat()):
+        with pytest.raises(ValidationError):
+            safety.validate_file_size(xlsx)
 
-    # restore Path.stat
-    monkeypatch.undo()
+    with patch.object(Path, "stat", side_effect=OSError("no"), autospec=True):
+        with pytest.raises(errors.FileAccessError):
+            safety.validate_file_size(xlsx)
 
     # create_backup failure
+    with (
+        patch.object(safety, "_clone_file", return_value=False),
+        patch.object(shutil, "copy2", side_effect=OSError("no")),
+    ):
+        with pytest.raises(errors.FileAccessError):
+            safety.create_backup(xlsx)
+
+
+def test_safety_create_backup_prefers_clone_and_falls_back_to_copy(
+    xlsx: Path, monkeypatch
+):
+    backup = xlsx.with_suffix(xlsx.suffix + safety.BACKUP_SUFFIX)
+
+    # Filesystem without reflink support: the failed clone leaves nothing
+    # behind and create_backup falls back to a plain copy.
+    def no_reflink(*_args):
+        raise OSError("Operation not supported")
+
+    monkeypatch.setattr(safety.fcntl, "ioctl", no_reflink)
+    assert safety._clone_file(xlsx, backup) is False
+    assert not backup.exists()
+    assert safety.create_backup(xlsx).read_bytes() == xlsx.read_bytes()
+    backup.unlink()
+
+    # Successful clone: no byte copy is made.
+    def fake_reflink(dst_fd, _request, src_fd):
+        os.write(dst_fd, os.read(src_fd, 1 << 20))
+
     def boom_copy(*args, **kwargs):
-        raise OSError("no")
+        raise AssertionError("copy2 should not be used after a clone")
 
+    monkeypatch.setattr(safety.fcntl, "ioctl", fake_reflink)
     monkeypatch.setattr(shutil, "copy2", boom_copy)
-    with pytest.raises(errors.FileAccessError):
-        safety.create_backup(xlsx)
+    assert safety.create_backup(xlsx) == backup
+    assert backup.read_bytes() == xlsx.read_bytes()
 
+    monkeypatch.setattr(safety, "FCNTL_AVAILABLE", False)
+    assert safety._clone_file(xlsx, backup) is False
 
-def test_safety_restore_and_cleanup_edge_cases(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
 
+def test_safety_restore_and_cleanup_edge_cases(xlsx: Path, tmp_path: Path, monkeypatch):
     missing_backup = tmp_path / "book.xlsx.backup"
     with pytest.raises(errors.FileAccessError):
         safety.restore_backup(xlsx, missing_backup)
@@ -237,10 +284,7 @@ def test_sheet_and_cell_validation_more():
     assert safety.validate_cell_reference("a1") == "A1"
 
 
-def test_excel_processor_more_errors_and_formatting(tmp_path: Path):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-
+def test_excel_processor_more_errors_and_formatting(xlsx: Path, tmp_path: Path):
     proc = ExcelProcessor()
 
     # No workbook loaded paths
@@ -280,21 +324,243 @@ def test_excel_processor_more_errors_and_formatting(tmp_path: Path):
         proc2.delete_worksheet(proc2._workbook.sheetnames[0])
 
 
-def test_exporter_more_paths(tmp_path: Path, monkeypatch):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
+def test_excel_processor_iter_rows_values(xlsx: Path):
+    with pytest.raises(WorksheetError):
+        ExcelProcessor().iter_rows_values("Sales")
 
     proc = ExcelProcessor()
     proc.load_workbook(str(xlsx), read_only=False)
+
+    rows = list(proc.iter_rows_values())
+    assert rows[0] == ("Product", "Qty", "Price", "Total")
+    assert rows[1] == ("Widget", 2, 3, "=B2*C2")
+
+    assert list(proc.iter_rows_values("Sales", cell_range="B1:C2")) == [
+        ("Qty", "Price"),
+        (2, 3),
+    ]
+    # Cells outside the used area still keep their column positions
+    assert list(proc.iter_rows_values("Sales", cell_range="D2:E2")) == [
+        ("=B2*C2", None)
+    ]
+
+    with pytest.raises(WorksheetError):
+        proc.iter_rows_values("Missing")
+    with pytest.raises(WorksheetError):
+        proc.iter_rows_values("Sales", cell_range="A1:B2:C3")
+
+    proc.close_workbook()
+
+
+def test_excel_processor_flat_worksheet_data(xlsx: Path, monkeypatch):
+    proc = ExcelProcessor()
+    proc.load_workbook(str(xlsx))
+
+    flat = proc.get_worksheet_data("Sales", shape="flat")
+    assert flat["range"] == "A1:D2"
+    cells = proc.get_worksheet_data("Sales", shape="cells")
+    assert (cells["range"], cells["rows"], cells["columns"]) == (
+        flat["range"],
+        flat["rows"],
+        flat["columns"],
+    )
+    assert [[c["value"] for c in row] for row in cells["data"]] == flat["data"]
+    assert (flat["rows"], flat["columns"]) == (2, 4)
+    assert flat["data"][1] == ["Widget", 2, 3, "=B2*C2"]
+    assert flat["dtypes"] == ["str", "mixed", "mixed", "str"]
+    assert flat["formulas"] is None
+
+    # A ranged read takes its bounds from the range, never from the sheet
+    from openpyxl.worksheet.worksheet import Worksheet
+
+    def measured(_sheet):
+        raise AssertionError("measured")
+
+    with monkeypatch.context() as m:
+        m.setattr(Worksheet, "max_row", property(measured))
+        m.setattr(Worksheet, "max_column", property(measured))
+        ranged = proc.get_worksheet_data("Sales", cell_range="A2:B2", shape="cells")
+        ranged_flat = proc.get_worksheet_data("Sales", cell_range="A2:B2", shape="flat")
+    assert (ranged["range"], ranged["rows"], ranged["columns"]) == ("A2:B2", 1, 2)
+    assert ranged_flat["data"] == [["Widget", 2]]
+
+    part = proc.get_worksheet_data(
+        "Sales", include_formulas=True, cell_range="C2:D2", shape="flat"
+    )
+    assert part["data"] == [[3, "=B2*C2"]]
+    assert part["dtypes"] == ["int", "str"]
+    assert part["formulas"] == {"D2": "=B2*C2"}
+
+    empty = proc.get_worksheet_data("Empty", cell_range="A1:B1", shape="flat")
+    assert empty["dtypes"] == ["empty", "empty"]
+
+    with pytest.raises(WorksheetError):
+        proc.get_worksheet_data("Sales", shape="columns")
+    with pytest.raises(WorksheetError):
+        proc.get_worksheet_data("Missing", shape="flat")
+
+    proc.close_workbook()
+
+
+def test_excel_processor_flat_values_via_calamine(xlsx: Path, monkeypatch):
+    pytest.importorskip("python_calamine")
+    from xlsx_reader.processors import workbook as workbook_module
+
+    wb = openpyxl.load_workbook(xlsx)
+    wb.create_sheet("Dates").append(
+        [
+            datetime.date(2024, 1, 2),
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+            datetime.time(3, 4, 5),
+            datetime.timedelta(hours=30),
+        ]
+    )
+    wb.save(xlsx)
+
+    proc = ExcelProcessor()
+    proc.load_workbook(str(xlsx), read_only=True, data_only=True, keep_links=False)
+    expected = proc.get_worksheet_data("Sales", cell_range="A1:E3", shape="flat")
+    assert expected["data"] == [
+        ["Product", "Qty", "Price", "Total", None],
+        ["Widget", 2, 3, None, None],
+    ]
+    dates = proc.get_worksheet_data("Dates", shape="flat")
+    # calamine reads a date-only cell as date; openpyxl as midnight datetime
+    assert type(dates["data"][0][0]) is datetime.datetime
+
+    # Same result from openpyxl when calamine is unavailable or fails
+    monkeypatch.setattr(workbook_module, "CALAMINE_AVAILABLE", False)
+    assert proc.get_worksheet_data("Sales", cell_range="A1:E3", shape="flat") == (
+        expected
+    )
+    assert proc.get_worksheet_data("Dates", shape="flat") == dates
+    monkeypatch.undo()
+
+    def boom(*_args):
+        raise OSError("unreadable")
+
+    monkeypatch.setattr(proc, "_read_values_with_calamine", boom)
+    fallback = proc.get_worksheet_data("Sales", cell_range="A1:E3", shape="flat")
+    assert fallback["data"] == expected["data"]
+    proc.close_workbook()
+
+
+def test_excel_processor_load_workbook_data_only(xlsx: Path):
+    proc = ExcelProcessor()
+    info = proc.load_workbook(
+        str(xlsx), read_only=True, data_only=True, keep_links=False
+    )
+    assert info["has_formulas"] is False
+    # openpyxl never computes formulas, so an unsaved-by-Excel file has no
+    # cached result for D2.
+    assert list(proc.iter_rows_values("Sales"))[1] == ("Widget", 2, 3, None)
+    proc.close_workbook()
+
+
+def test_excel_processor_workbook_info_reads_bounds_once(xlsx: Path, monkeypatch):
+    from openpyxl.worksheet.worksheet import Worksheet
+
+    proc = ExcelProcessor()
+
+    reads = []
+    original = Worksheet.max_row
+
+    def counting_max_row(sheet):
+        reads.append(sheet.title)
+        return original.fget(sheet)
+
+    monkeypatch.setattr(Worksheet, "max_row", property(counting_max_row))
+    proc.load_workbook(str(xlsx))
+    assert reads[-2:] == ["Sales", "Empty"]
+    after_load = len(reads)
+
+    info = proc.get_workbook_info()
+    assert len(reads) == after_load
+    assert [s["dimensions"] for s in info["sheets"]] == ["A1:D2", "A1:A1"]
+
+    proc.update_cell_value("Sales", "E1", 1)
+    info = proc.get_workbook_info()
+    assert reads[after_load:] == ["Sales", "Empty"]
+    assert info["sheets"][0]["dimensions"] == "A1:E2"
+    proc.close_workbook()
+
+
+def test_excel_processor_reset_dimensions_ignores_lying_dimension_tag(
+    xlsx: Path, tmp_path: Path
+):
+    # Rewrite the Sales sheet so its <dimension> claims a far larger range.
+    bad = tmp_path / "bad.xlsx"
+    with zipfile.ZipFile(xlsx) as src, zipfile.ZipFile(bad, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(b'<dimension ref="A1:D2"', b'<dimension ref="A1:Z500"')
+            dst.writestr(item, data)
+
+    # The recorded range is trusted: every row is padded out to column Z.
+    proc = ExcelProcessor()
+    info = proc.load_workbook(str(bad), read_only=True)
+    assert info["sheets"][0]["dimensions"] == "A1:Z500"
+    assert [len(row) for row in proc.iter_rows_values("Sales")] == [26, 26]
+    proc.close_workbook()
+
+    info = proc.load_workbook(str(bad), read_only=True, reset_dimensions=True)
+    assert info["sheets"][0]["max_row"] is None
+    assert info["sheets"][0]["dimensions"] is None
+    assert list(proc.iter_rows_values("Sales")) == [
+        ("Product", "Qty", "Price", "Total"),
+        ("Widget", 2, 3, "=B2*C2"),
+    ]
+
+    # Ranged reads never measure the sheet; the range gives the bounds.
+    with patch.object(
+        ExcelProcessor, "_sheet_bounds", side_effect=AssertionError("measured")
+    ):
+        cells = proc.get_worksheet_data("Sales", cell_range="A2:B2")
+        assert (cells["range"], cells["rows"], cells["columns"]) == ("A2:B2", 1, 2)
+        flat = proc.get_worksheet_data("Sales", cell_range="A2:B2", shape="flat")
+        assert flat["data"] == [["Widget", 2]]
+
+    # Whole-sheet reads measure the unsized sheet instead of failing on None.
+    cells = proc.get_worksheet_data("Sales")
+    assert (cells["range"], cells["rows"], cells["columns"]) == ("A1:D2", 2, 4)
+    flat = proc.get_worksheet_data("Sales", shape="flat")
+    assert flat["range"] == "A1:D2"
+    assert flat["data"][1] == ["Widget", 2, 3, "=B2*C2"]
+    proc.close_workbook()
+
+
+def test_excel_processor_is_loaded_matches_resolved_paths(
+    xlsx: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(tmp_path)
+
+    proc = ExcelProcessor()
+    assert proc.is_loaded("book.xlsx") is False
+
+    proc.load_workbook("./book.xlsx")
+    assert proc.get_loaded_file_path_str() == str(xlsx.resolve())
+    assert proc.is_loaded("book.xlsx") is True
+    assert proc.is_loaded(str(xlsx)) is True
+    assert proc.is_loaded("other.xlsx") is False
+
+    proc.close_workbook()
+    assert proc.is_loaded("book.xlsx") is False
+    assert proc.get_loaded_file_path_str() is None
+
+
+def test_exporter_more_paths(xlsx: Path, tmp_path: Path, monkeypatch):
+    proc = ExcelProcessor()
+    proc.load_workbook(str(xlsx), read_only=False)
     exporter = DataExporter(proc)
 
     # Empty sheet export -> success_response path
-    orig_get = proc.get_worksheet_data
-    monkeypatch.setattr(proc, "get_worksheet_data", lambda _name: {"data": []})
+    orig_iter = proc.iter_rows_values
+    monkeypatch.setattr(proc, "iter_rows_values", lambda _name: iter(()))
     r = exporter.export_worksheet_to_csv("Empty")
     assert r["ok"] is True
 
-    monkeypatch.setattr(proc, "get_worksheet_data", orig_get)
+    monkeypatch.setattr(proc, "iter_rows_values", orig_iter)
 
     # Save CSV to file
     out_csv = tmp_path / "out.csv"
@@ -326,12 +592,8 @@ def test_exporter_more_paths(tmp_path: Path, monkeypatch):
     assert df.shape[0] == 2
 
 
-def test_chart_processor_more_error_paths(tmp_path: Path):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
-
-    wb = openpyxl.load_workbook(xlsx, read_only=False, data_only=False)
-    charts = ChartProcessor(wb)
+def test_chart_processor_more_error_paths(shared_workbook):
+    charts = ChartProcessor(shared_workbook)
 
     with pytest.raises(ChartError):
         charts.extract_charts_from_sheet("Missing")
@@ -350,15 +612,9 @@ def test_chart_processor_more_error_paths(tmp_path: Path):
     all_charts = charts.extract_all_charts()
     assert "Sales" not in all_charts or isinstance(all_charts.get("Sales"), (list, dict))
 
-    wb.close()
-
-
-def test_pivot_processor_error_paths(tmp_path: Path):
-    xlsx = tmp_path / "book.xlsx"
-    _create_workbook(xlsx)
 
-    wb = openpyxl.load_workbook(xlsx, read_only=False, data_only=False)
-    piv = PivotTableProcessor(wb)
+def test_pivot_processor_error_paths(shared_workbook):
+    piv = PivotTableProcessor(shared_workbook)
 
     with pytest.raises(PivotTableError):
         piv.extract_pivot_tables_from_sheet("Missing")
@@ -379,5 +635,3 @@ def test_pivot_processor_error_paths(tmp_path: Path):
 
     with pytest.raises(PivotTableError):
         piv.create_pivot_table("Sales", "A1:A1", "Nope", "A1", {})
-
-    wb.close()
@@ -11,7 +11,14 @@ Exercises:
   cleanup that always closes the workbook
 """
 
+import asyncio
+import datetime
 import json
+import logging
+import os
+import shutil
+import threading
+from decimal import Decimal
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -19,7 +26,13 @@ import openpyxl
 import pytest
 from mcp.types import TextContent
 
+from xlsx_reader import safety
+from xlsx_reader import server as server_module
+from xlsx_reader.processors.workbook import ExcelProcessor
+
 from xlsx_reader.server import (
+    MAX_CACHED_WORKBOOKS,
+    _TOOL_DISPATCH,
     _add_worksheet,
     _delete_worksheet,
     _export_to_csv,
@@ -27,8 +40,13 @@ from xlsx_reader.server import (
     _read_worksheet_data,
     _save_workbook,
     _update_cell_range,
+    _close_cached_workbooks,
+    _dumps,
+    _get_processor,
+    _path_lock,
+    _run_io,
     _update_cell_value,
-    excel_processor,
+    _workbook_cache,
     handle_call_tool,
     handle_list_resources,
     handle_list_tools,
@@ -58,10 +76,10 @@ def sample_workbook(tmp_path):
     wb.save(path)
     wb.close()
     yield path
-    # Best-effort: ensure the global processor releases the workbook
-    # between tests so subsequent tests can reload from disk cleanly.
+    # Best-effort: ensure cached workbooks are released between tests so
+    # subsequent tests can reload from disk cleanly.
     try:
-        excel_processor.close_workbook()
+        _close_cached_workbooks()
     except Exception:  # noqa: BLE001
         pass
 
@@ -96,6 +114,8 @@ async def test_list_tools_returns_all_eight_xlsx_tools():
     for tool in tools:
         assert tool.description
         assert tool.inputSchema
+    # The listing is built once at import time and reused.
+    assert await handle_list_tools() is tools
 
 
 # ---------------------------------------------------------------------------
@@ -109,6 +129,7 @@ async def test_list_resources_returns_two_known_uris():
     resources = await handle_list_resources()
     uris = {str(r.uri) for r in resources}
     assert uris == {"xlsx://supported-formats", "xlsx://server-status"}
+    assert await handle_list_resources() is resources
 
 
 @pytest.mark.asyncio
@@ -123,31 +144,54 @@ async def test_read_resource_supported_formats_includes_xlsx_extensions():
 @pytest.mark.asyncio
 async def test_read_resource_server_status_with_no_workbook_loaded():
     """server-status reports workbook_loaded == False when none is loaded."""
-    excel_processor.close_workbook()
-    payload = json.loads(await handle_read_resource("xlsx://server-status"))
+    _close_cached_workbooks()
+    text = await handle_read_resource("xlsx://server-status")
+    payload = json.loads(text)
     assert payload["server"] == "xlsx-reader"
     assert payload["workbook_loaded"] is False
     assert payload["current_workbook"] is None
+    assert payload["cached_workbooks"] == 0
+    assert await handle_read_resource("xlsx://server-status") is text
 
 
 @pytest.mark.asyncio
 async def test_read_resource_server_status_with_workbook_loaded(sample_workbook):
     """server-status reports workbook_loaded == True after loading a file."""
-    excel_processor.load_workbook(str(sample_workbook), read_only=True)
+    await _get_processor(str(sample_workbook), read_only=True)
     payload = json.loads(await handle_read_resource("xlsx://server-status"))
+    assert payload["server"] == "xlsx-reader"
     assert payload["workbook_loaded"] is True
     assert payload["current_workbook"] is not None
+    assert payload["cached_workbooks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_read_resource_server_status_waits_for_path_lock(sample_workbook):
+    """server-status does not read the workbook while a handler holds it."""
+    await _get_processor(str(sample_workbook), read_only=True)
+    with patch.object(
+        ExcelProcessor, "get_workbook_info", return_value={"sheet_names": []}
+    ) as info:
+        async with _path_lock(str(sample_workbook)):
+            task = asyncio.create_task(handle_read_resource("xlsx://server-status"))
+            await asyncio.sleep(0.05)
+            assert not task.done()
+            info.assert_not_called()
+        payload = json.loads(await task)
+    assert payload["workbook_loaded"] is True
 
 
 @pytest.mark.asyncio
-async def test_read_resource_server_status_handles_processor_exception():
+async def test_read_resource_server_status_handles_processor_exception(
+    sample_workbook,
+):
     """If get_workbook_info raises, server-status falls back to None workbook info."""
-    with patch.object(excel_processor, "is_workbook_loaded", return_value=True), \
-         patch.object(
-             excel_processor,
-             "get_workbook_info",
-             side_effect=RuntimeError("processor exploded"),
-         ):
+    await _get_processor(str(sample_workbook), read_only=True)
+    with patch.object(
+        ExcelProcessor,
+        "get_workbook_info",
+        side_effect=RuntimeError("processor exploded"),
+    ):
         payload = json.loads(await handle_read_resource("xlsx://server-status"))
     assert payload["workbook_loaded"] is False
     assert payload["current_workbook"] is None
@@ -181,11 +225,10 @@ async def test_read_resource_unknown_uri_raises_value_error():
 @pytest.mark.asyncio
 async def test_call_tool_routes_to_named_implementation(tool_name, target_attr):
     """Each registered tool name routes through call_tool to its impl."""
+    assert _TOOL_DISPATCH[tool_name] is getattr(server_module, target_attr)
     sentinel = {"ok": True, "data": {"routed": tool_name}}
-    with patch(
-        f"xlsx_reader.server.{target_attr}",
-        new=AsyncMock(return_value=sentinel),
-    ) as handler:
+    handler = AsyncMock(return_value=sentinel)
+    with patch.dict(_TOOL_DISPATCH, {tool_name: handler}):
         result = await handle_call_tool(tool_name, {"file_path": "x.xlsx"})
     handler.assert_awaited_once()
     assert _envelope(result) == sentinel
@@ -208,12 +251,28 @@ async def test_call_tool_non_dict_arguments_coerced_to_empty_dict():
     assert payload["code"] == "UserInput"
 
 
+@pytest.mark.asyncio
+async def test_call_tool_encodes_arguments_only_for_debug_logging(caplog):
+    """Argument payloads are JSON-encoded only when DEBUG is enabled."""
+    args = {"values": [[1, 2]]}
+    with patch("xlsx_reader.server._dumps", wraps=server_module._dumps) as dumps:
+        with caplog.at_level(logging.INFO, logger="xlsx_reader.server"):
+            await handle_call_tool("nonexistent_tool", args)
+        assert dumps.call_count == 1  # the response only
+        assert "args=['values']" in caplog.text
+
+        with caplog.at_level(logging.DEBUG, logger="xlsx_reader.server"):
+            await handle_call_tool("nonexistent_tool", args)
+        assert dumps.call_count == 3
+    assert 'args-json={"values":[[1,2]]}' in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_call_tool_unexpected_exception_returns_internal_error_envelope():
     """An unhandled exception is caught and reported as Internal."""
-    with patch(
-        "xlsx_reader.server._read_workbook_info",
-        new=AsyncMock(side_effect=RuntimeError("boom")),
+    with patch.dict(
+        _TOOL_DISPATCH,
+        {"read_workbook_info": AsyncMock(side_effect=RuntimeError("boom"))},
     ):
         payload = _envelope(await handle_call_tool("read_workbook_info", {}))
     assert payload["ok"] is False
@@ -224,15 +283,53 @@ async def test_call_tool_unexpected_exception_returns_internal_error_envelope():
 @pytest.mark.asyncio
 async def test_call_tool_non_envelope_result_normalized_to_envelope():
     """When a tool returns a bare value, server wraps it as {ok, data}."""
-    with patch(
-        "xlsx_reader.server._read_workbook_info",
-        new=AsyncMock(return_value=["a", "b"]),
+    with patch.dict(
+        _TOOL_DISPATCH,
+        {"read_workbook_info": AsyncMock(return_value=["a", "b"])},
     ):
         payload = _envelope(await handle_call_tool("read_workbook_info", {}))
     assert payload["ok"] is True
     assert payload["data"] == ["a", "b"]
 
 
+def test_dumps_falls_back_to_compact_stdlib_json():
+    """Without orjson, responses are serialized compactly with json."""
+    with patch("xlsx_reader.server.ORJSON_AVAILABLE", False):
+        text = _dumps({"ok": True, "data": {"when": Path("a.xlsx")}})
+    assert text == '{"ok":true,"data":{"when":"a.xlsx"}}'
+
+
+def test_dumps_uses_orjson_when_installed():
+    """With orjson installed, output round-trips and non-str keys are kept."""
+    pytest.importorskip("orjson")
+    with patch("xlsx_reader.server.ORJSON_AVAILABLE", True):
+        text = _dumps({"ok": True, 1: Path("a.xlsx")})
+    assert json.loads(text) == {"ok": True, "1": "a.xlsx"}
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_dumps_encodes_cell_value_types_consistently(use_orjson):
+    """Dates come out as ISO 8601 and other values as str with either encoder."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    value = {
+        "when": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        "day": datetime.date(2024, 1, 2),
+        "at": datetime.time(3, 4),
+        "amount": Decimal("1.50"),
+        "span": datetime.timedelta(days=1),
+    }
+    with patch("xlsx_reader.server.ORJSON_AVAILABLE", use_orjson):
+        payload = json.loads(_dumps(value))
+    assert payload == {
+        "when": "2024-01-02T03:04:05",
+        "day": "2024-01-02",
+        "at": "03:04:00",
+        "amount": "1.50",
+        "span": "1 day, 0:00:00",
+    }
+
+
 # ---------------------------------------------------------------------------
 # Per-tool implementation: validation branches
 # ---------------------------------------------------------------------------
@@ -278,6 +375,22 @@ async def test_update_cell_range_requires_full_arg_set():
     result = await _update_cell_range({"file_path": "x.xlsx"})
     assert result["ok"] is False
     assert result["code"] == "UserInput"
+    assert result["missing"] == ["sheet_name", "cell_range", "values"]
+
+
+@pytest.mark.asyncio
+async def test_update_cell_range_accepts_empty_values_list(sample_workbook):
+    """An empty values list is valid input, not a missing parameter."""
+    result = await _update_cell_range(
+        {
+            "file_path": str(sample_workbook),
+            "sheet_name": "Sheet1",
+            "cell_range": "A1:B2",
+            "values": [],
+        }
+    )
+    assert result["ok"] is True
+    assert result["data"]["cells_updated"] == 0
 
 
 @pytest.mark.asyncio
@@ -295,6 +408,22 @@ async def test_update_cell_range_requires_values_to_be_a_list():
     assert "2D array" in result["message"]
 
 
+@pytest.mark.asyncio
+async def test_update_cell_range_rejects_flat_values_list():
+    """A 1D values list is rejected before the workbook is touched."""
+    result = await _update_cell_range(
+        {
+            "file_path": "x.xlsx",
+            "sheet_name": "S",
+            "cell_range": "A1:B1",
+            "values": [1, 2],
+        }
+    )
+    assert result["ok"] is False
+    assert result["code"] == "UserInput"
+    assert "2D array" in result["message"]
+
+
 @pytest.mark.asyncio
 async def test_add_worksheet_requires_file_and_sheet_name():
     """_add_worksheet enforces both required parameters."""
@@ -330,7 +459,7 @@ async def test_save_workbook_requires_file_path():
 @pytest.mark.asyncio
 async def test_save_workbook_rejects_when_no_workbook_loaded():
     """_save_workbook returns UserInput when no workbook is currently loaded."""
-    excel_processor.close_workbook()
+    _close_cached_workbooks()
     result = await _save_workbook({"file_path": "x.xlsx"})
     assert result["ok"] is False
     assert "No workbook" in result["message"]
@@ -342,43 +471,43 @@ async def test_save_workbook_rejects_when_no_workbook_loaded():
 
 
 @pytest.mark.asyncio
-async def test_read_workbook_info_wraps_processor_exception():
+async def test_read_workbook_info_wraps_processor_exception(sample_workbook):
     """_read_workbook_info returns Internal envelope when processor raises."""
     with patch.object(
-        excel_processor,
+        ExcelProcessor,
         "load_workbook",
         side_effect=RuntimeError("disk error"),
     ):
-        result = await _read_workbook_info({"file_path": "x.xlsx"})
+        result = await _read_workbook_info({"file_path": str(sample_workbook)})
     assert result["ok"] is False
     assert result["code"] == "Internal"
     assert "disk error" in result["detail"]
 
 
 @pytest.mark.asyncio
-async def test_read_worksheet_data_wraps_processor_exception():
+async def test_read_worksheet_data_wraps_processor_exception(sample_workbook):
     """_read_worksheet_data returns Internal envelope when processor raises."""
     with patch.object(
-        excel_processor,
+        ExcelProcessor,
         "load_workbook",
         side_effect=RuntimeError("disk error"),
     ):
-        result = await _read_worksheet_data({"file_path": "x.xlsx"})
+        result = await _read_worksheet_data({"file_path": str(sample_workbook)})
     assert result["ok"] is False
     assert result["code"] == "Internal"
 
 
 @pytest.mark.asyncio
-async def test_update_cell_value_wraps_processor_exception():
+async def test_update_cell_value_wraps_processor_exception(sample_workbook):
     """_update_cell_value returns Internal envelope when processor raises."""
     with patch.object(
-        excel_processor,
+        ExcelProcessor,
         "load_workbook",
         side_effect=RuntimeError("disk error"),
-    ), patch("xlsx_reader.server.FileOperationContext"):
+    ):
         result = await _update_cell_value(
             {
-                "file_path": "x.xlsx",
+                "file_path": str(sample_workbook),
                 "sheet_name": "S",
                 "cell_ref": "A1",
                 "value": "v",
@@ -389,16 +518,16 @@ async def test_update_cell_value_wraps_processor_exception():
 
 
 @pytest.mark.asyncio
-async def test_update_cell_range_wraps_processor_exception():
+async def test_update_cell_range_wraps_processor_exception(sample_workbook):
     """_update_cell_range returns Internal envelope when processor raises."""
     with patch.object(
-        excel_processor,
+        ExcelProcessor,
         "load_workbook",
         side_effect=RuntimeError("disk error"),
-    ), patch("xlsx_reader.server.FileOperationContext"):
+    ):
         result = await _update_cell_range(
             {
-                "file_path": "x.xlsx",
+                "file_path": str(sample_workbook),
                 "sheet_name": "S",
                 "cell_range": "A1:B2",
                 "values": [[1, 2], [3, 4]],
@@ -409,45 +538,45 @@ async def test_update_cell_range_wraps_processor_exception():
 
 
 @pytest.mark.asyncio
-async def test_add_worksheet_wraps_processor_exception():
+async def test_add_worksheet_wraps_processor_exception(sample_workbook):
     """_add_worksheet returns Internal envelope when processor raises."""
     with patch.object(
-        excel_processor,
+        ExcelProcessor,
         "load_workbook",
         side_effect=RuntimeError("disk error"),
-    ), patch("xlsx_reader.server.FileOperationContext"):
+    ):
         result = await _add_worksheet(
-            {"file_path": "x.xlsx", "sheet_name": "Sheet2"}
+            {"file_path": str(sample_workbook), "sheet_name": "Sheet2"}
         )
     assert result["ok"] is False
     assert result["code"] == "Internal"
 
 
 @pytest.mark.asyncio
-async def test_delete_worksheet_wraps_processor_exception():
+async def test_delete_worksheet_wraps_processor_exception(sample_workbook):
     """_delete_worksheet returns Internal envelope when processor raises."""
     with patch.object(
-        excel_processor,
+        ExcelProcessor,
         "load_workbook",
         side_effect=RuntimeError("disk error"),
-    ), patch("xlsx_reader.server.FileOperationContext"):
+    ):
         result = await _delete_worksheet(
-            {"file_path": "x.xlsx", "sheet_name": "Sheet2"}
+            {"file_path": str(sample_workbook), "sheet_name": "Sheet2"}
         )
     assert result["ok"] is False
     assert result["code"] == "Internal"
 
 
 @pytest.mark.asyncio
-async def test_export_to_csv_wraps_processor_exception():
+async def test_export_to_csv_wraps_processor_exception(sample_workbook):
     """_export_to_csv returns Internal envelope when processor raises."""
     with patch.object(
-        excel_processor,
+        ExcelProcessor,
         "load_workbook",
         side_effect=RuntimeError("disk error"),
     ):
         result = await _export_to_csv(
-            {"file_path": "x.xlsx", "sheet_name": "Sheet1"}
+            {"file_path": str(sample_workbook), "sheet_name": "Sheet1"}
         )
     assert result["ok"] is False
     assert result["code"] == "Internal"
@@ -456,9 +585,9 @@ async def test_export_to_csv_wraps_processor_exception():
 @pytest.mark.asyncio
 async def test_save_workbook_wraps_processor_exception(sample_workbook):
     """_save_workbook returns Internal envelope when processor raises on save."""
-    excel_processor.load_workbook(str(sample_workbook), read_only=False)
+    await _get_processor(str(sample_workbook), read_only=False)
     with patch.object(
-        excel_processor,
+        ExcelProcessor,
         "save_workbook",
         side_effect=RuntimeError("disk error"),
     ):
@@ -487,6 +616,30 @@ async def test_read_worksheet_data_success(sample_workbook):
         {"file_path": str(sample_workbook), "sheet_name": "Sheet1"}
     )
     assert result["ok"] is True
+    assert result["data"]["shape"] == "flat"
+    assert result["data"]["data"] == [["Name", "Value"], ["alpha", 1], ["beta", 2]]
+    assert result["data"]["dtypes"] == ["str", "mixed"]
+
+
+@pytest.mark.asyncio
+async def test_read_worksheet_data_cells_shape_and_invalid_shape(sample_workbook):
+    """shape='cells' keeps per-cell dicts; unknown shapes are UserInput."""
+    result = await _read_worksheet_data(
+        {
+            "file_path": str(sample_workbook),
+            "sheet_name": "Sheet1",
+            "cell_range": "A1:B1",
+            "shape": "cells",
+        }
+    )
+    assert result["ok"] is True
+    assert result["data"]["data"][0][0]["value"] == "Name"
+
+    bad = await _read_worksheet_data(
+        {"file_path": str(sample_workbook), "shape": "columns"}
+    )
+    assert bad["ok"] is False
+    assert bad["code"] == "UserInput"
 
 
 @pytest.mark.asyncio
@@ -496,8 +649,12 @@ async def test_export_to_csv_inline_payload(sample_workbook):
         {"file_path": str(sample_workbook), "sheet_name": "Sheet1"}
     )
     assert result["ok"] is True
-    assert "csv_data" in result["data"]
-    assert "Name" in result["data"]["csv_data"]
+    assert result["data"]["rows_exported"] == 3
+    assert result["data"]["csv_data"].splitlines() == [
+        "Name,Value",
+        "alpha,1",
+        "beta,2",
+    ]
 
 
 @pytest.mark.asyncio
@@ -517,6 +674,7 @@ async def test_export_to_csv_writes_file_when_output_path_given(
     assert result["data"]["saved_to"] == str(out)
     assert out.exists()
     assert "Name" in out.read_text(encoding="utf-8")
+    assert result["data"]["file_size"] == out.stat().st_size
 
 
 @pytest.mark.asyncio
@@ -534,6 +692,334 @@ async def test_export_to_csv_drops_header_row_when_disabled(sample_workbook):
     assert "Name" not in result["data"]["csv_data"]
 
 
+# ---------------------------------------------------------------------------
+# Workbook cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_get_processor_reuses_cached_workbook(sample_workbook):
+    """A second lookup for an unchanged file returns the same processor."""
+    first = await _get_processor(str(sample_workbook), read_only=True)
+    assert await _get_processor(str(sample_workbook), read_only=True) is first
+    assert len(_workbook_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_processor_read_prefers_cached_editable_workbook(sample_workbook):
+    """Reads are served from an editable processor so unsaved edits show up."""
+    editable = await _get_processor(str(sample_workbook), read_only=False)
+    editable.update_cell_value("Sheet1", "A2", "edited")
+    reader = await _get_processor(str(sample_workbook), read_only=True)
+    assert reader is editable
+    data = reader.get_worksheet_data("Sheet1", cell_range="A2")
+    assert data["data"][0][0]["value"] == "edited"
+
+
+@pytest.mark.asyncio
+async def test_get_processor_drops_stale_entries_when_file_changes(sample_workbook):
+    """A newer mtime reloads the file and closes the outdated processor."""
+    stale = await _get_processor(str(sample_workbook), read_only=True)
+    st = sample_workbook.stat()
+    os.utime(sample_workbook, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    fresh = await _get_processor(str(sample_workbook), read_only=True)
+    assert fresh is not stale
+    assert not stale.is_workbook_loaded()
+    assert len(_workbook_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_processor_refuses_to_drop_unsaved_edits_on_file_change(
+    sample_workbook, caplog
+):
+    """A file touched on disk never silently discards unsaved in-memory edits."""
+    args = {"file_path": str(sample_workbook), "sheet_name": "Sheet1"}
+    edited = await _update_cell_value({**args, "cell_ref": "A2", "value": "edited"})
+    assert edited["ok"] is True
+    st = sample_workbook.stat()
+    os.utime(sample_workbook, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    with caplog.at_level(logging.WARNING, logger="xlsx_reader.server"):
+        refused = await _read_worksheet_data({**args, "include_formulas": True})
+    assert refused["ok"] is False
+    assert "unsaved changes" in refused["detail"]
+    assert "changed on disk" in caplog.text
+    assert len(_workbook_cache) == 1
+    assert next(iter(_workbook_cache.values())).has_unsaved_changes()
+
+    # Saving keeps the edits and lets reads continue against the new file
+    assert (await _save_workbook({"file_path": str(sample_workbook)}))["ok"] is True
+    reread = await _read_worksheet_data(args)
+    assert reread["data"]["data"][1][0] == "edited"
+
+
+@pytest.mark.asyncio
+async def test_get_processor_evicts_least_recently_used(sample_workbook, tmp_path):
+    """Exceeding MAX_CACHED_WORKBOOKS closes the oldest processor."""
+    paths = []
+    for i in range(MAX_CACHED_WORKBOOKS + 1):
+        path = tmp_path / f"copy{i}.xlsx"
+        shutil.copyfile(sample_workbook, path)
+        paths.append(path)
+    oldest = await _get_processor(str(paths[0]), read_only=True)
+    for path in paths[1:]:
+        await _get_processor(str(path), read_only=True)
+    assert len(_workbook_cache) == MAX_CACHED_WORKBOOKS
+    assert not oldest.is_workbook_loaded()
+
+
+@pytest.mark.asyncio
+async def test_get_processor_never_evicts_workbook_in_use(sample_workbook, tmp_path):
+    """A processor whose path lock is held survives cache overflow."""
+    paths = []
+    for i in range(MAX_CACHED_WORKBOOKS + 1):
+        path = tmp_path / f"copy{i}.xlsx"
+        shutil.copyfile(sample_workbook, path)
+        paths.append(path)
+    async with _path_lock(str(paths[0])):
+        busy = await _get_processor(str(paths[0]), read_only=True)
+        for path in paths[1:]:
+            await _get_processor(str(path), read_only=True)
+    assert busy.is_workbook_loaded()
+    assert len(_workbook_cache) == MAX_CACHED_WORKBOOKS
+
+
+@pytest.mark.asyncio
+async def test_path_lock_is_shared_while_used_and_then_forgotten(sample_workbook):
+    """Callers share one lock per path, and idle locks are not kept around."""
+    path_str = str(sample_workbook.resolve())
+    lock = _path_lock(str(sample_workbook))
+    async with lock:
+        alias = sample_workbook.parent / "." / sample_workbook.name
+        assert _path_lock(str(alias)) is lock
+        assert path_str in server_module._path_locks
+    del lock
+    assert path_str not in server_module._path_locks
+
+
+@pytest.mark.asyncio
+async def test_run_io_executes_on_worker_thread():
+    """Blocking work is handed to the xlsx-io pool, off the event loop."""
+    name = await _run_io(lambda: threading.current_thread().name)
+    assert name.startswith("xlsx-io")
+
+
+@pytest.mark.asyncio
+async def test_edit_then_save_keeps_cached_processor(sample_workbook):
+    """Saving in place re-keys the cache so the next edit skips reloading."""
+    result = await _update_cell_value(
+        {
+            "file_path": str(sample_workbook),
+            "sheet_name": "Sheet1",
+            "cell_ref": "B2",
+            "value": 42,
+        }
+    )
+    assert result["ok"] is True
+    editable = await _get_processor(str(sample_workbook), read_only=False)
+
+    saved = await _save_workbook({"file_path": str(sample_workbook)})
+    assert saved["ok"] is True
+    assert await _get_processor(str(sample_workbook), read_only=False) is editable
+
+    reloaded = openpyxl.load_workbook(sample_workbook)
+    assert reloaded["Sheet1"]["B2"].value == 42
+    reloaded.close()
+
+
+@pytest.mark.asyncio
+async def test_edits_share_one_backup_taken_at_save(sample_workbook, tmp_path):
+    """Edits stay in memory; only the save that overwrites a file backs it up."""
+    with patch(
+        "xlsx_reader.safety.create_backup", wraps=safety.create_backup
+    ) as backup:
+        for ref in ("B2", "B3"):
+            await _update_cell_value(
+                {
+                    "file_path": str(sample_workbook),
+                    "sheet_name": "Sheet1",
+                    "cell_ref": ref,
+                    "value": 7,
+                }
+            )
+        editable = await _get_processor(str(sample_workbook), read_only=False)
+        assert editable.has_unsaved_changes()
+        assert backup.call_count == 0
+
+        copy_path = tmp_path / "copy.xlsx"
+        saved = await _save_workbook(
+            {"file_path": str(sample_workbook), "save_as_path": str(copy_path)}
+        )
+        assert saved["ok"] is True
+        assert backup.call_count == 0
+
+        await _update_cell_value(
+            {
+                "file_path": str(sample_workbook),
+                "sheet_name": "Sheet1",
+                "cell_ref": "B2",
+                "value": 8,
+            }
+        )
+        saved = await _save_workbook({"file_path": str(sample_workbook)})
+        assert saved["ok"] is True
+        assert backup.call_count == 1
+    assert not editable.has_unsaved_changes()
+
+
+@pytest.mark.asyncio
+async def test_only_saving_enters_file_operation_context(sample_workbook):
+    """Edit handlers never open FileOperationContext; _save_with_backup does."""
+    path = str(sample_workbook)
+    with patch(
+        "xlsx_reader.server.FileOperationContext", wraps=safety.FileOperationContext
+    ) as context:
+        sheet = {"file_path": path, "sheet_name": "Sheet1"}
+        results = [
+            await _update_cell_value({**sheet, "cell_ref": "B2", "value": 5}),
+            await _update_cell_range(
+                {**sheet, "cell_range": "A2:B2", "values": [["x", 1]]}
+            ),
+            await _add_worksheet({"file_path": path, "sheet_name": "Extra"}),
+            await _delete_worksheet({"file_path": path, "sheet_name": "Extra"}),
+        ]
+        assert all(result["ok"] for result in results)
+        context.assert_not_called()
+
+        assert (await _save_workbook({"file_path": path}))["ok"] is True
+    context.assert_called_once_with(path, create_backup=True)
+
+
+@pytest.mark.asyncio
+async def test_read_workbook_info_is_cached_until_file_or_workbook_changes(
+    sample_workbook,
+):
+    """Unchanged files skip get_workbook_info; edits and writes invalidate."""
+    args = {"file_path": str(sample_workbook)}
+    with patch.object(
+        ExcelProcessor,
+        "get_workbook_info",
+        autospec=True,
+        side_effect=ExcelProcessor.get_workbook_info,
+    ) as info:
+        first = await _read_workbook_info(args)
+        calls = info.call_count
+        second = await _read_workbook_info(args)
+        assert second == first
+        assert info.call_count == calls
+
+        await _add_worksheet({"file_path": str(sample_workbook), "sheet_name": "New"})
+        edited = await _read_workbook_info(args)
+        assert "New" in edited["data"]["sheet_names"]
+        assert info.call_count > calls
+
+        assert (await _save_workbook(args))["ok"] is True
+        calls = info.call_count
+        st = os.stat(sample_workbook)
+        os.utime(sample_workbook, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        await _read_workbook_info(args)
+        assert info.call_count > calls
+
+
+@pytest.mark.asyncio
+async def test_get_processor_caches_value_only_loads_separately(sample_workbook):
+    """data_only reads use their own entry; editable loads ignore it."""
+    formulas = await _get_processor(str(sample_workbook), read_only=True)
+    values = await _get_processor(
+        str(sample_workbook), read_only=True, data_only=True
+    )
+    assert values is not formulas
+    assert values._workbook.data_only is True
+    assert formulas.is_workbook_loaded()
+    assert (
+        await _get_processor(str(sample_workbook), read_only=True, data_only=True)
+        is values
+    )
+
+    editable = await _get_processor(
+        str(sample_workbook), read_only=False, data_only=True
+    )
+    assert editable._workbook.data_only is False
+    assert (
+        await _get_processor(str(sample_workbook), read_only=True, data_only=True)
+        is values
+    )
+    # Once it has unsaved edits, value reads follow the editable workbook
+    editable.update_cell_value("Sheet1", "B2", 99)
+    assert (
+        await _get_processor(str(sample_workbook), read_only=True, data_only=True)
+        is editable
+    )
+
+
+@pytest.mark.asyncio
+async def test_value_reads_agree_with_other_tools_after_unsaved_edits(tmp_path):
+    """Default reads see unsaved edits, just like info and CSV export do."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws.append(["a", 1, "=B1*2"])
+    path = tmp_path / "formulas.xlsx"
+    wb.save(path)
+    wb.close()
+    args = {"file_path": str(path), "sheet_name": "Sheet1"}
+    try:
+        before = await _read_worksheet_data(args)
+        assert (await _add_worksheet({**args, "sheet_name": "New"}))["ok"] is True
+        assert (
+            await _update_cell_value({**args, "cell_ref": "A1", "value": "edited"})
+        )["ok"] is True
+        info = await _read_workbook_info(args)
+        after = await _read_worksheet_data(args)
+        new_sheet = await _read_worksheet_data({**args, "sheet_name": "New"})
+        csv = await _export_to_csv(args)
+        assert (await _save_workbook(args))["ok"] is True
+        saved = await _read_worksheet_data(args)
+    finally:
+        _close_cached_workbooks()
+    # openpyxl saves no cached results, so the formula cell has no value
+    assert before["data"]["data"] == [["a", 1, None]]
+    assert info["data"]["sheet_names"] == ["Sheet1", "New"]
+    assert new_sheet["ok"] is True
+    # Unsaved formula cells come back as formula strings
+    assert after["data"]["data"] == [["edited", 1, "=B1*2"]]
+    assert csv["data"]["csv_data"].splitlines() == ["edited,1,=B1*2"]
+    assert saved["data"]["data"] == [["edited", 1, None]]
+
+
+@pytest.mark.asyncio
+async def test_get_processor_skips_external_links_unless_editable(
+    sample_workbook, monkeypatch
+):
+    """Only editable loads keep external links, since only they are saved."""
+    calls = []
+    original = ExcelProcessor.load_workbook
+
+    def spy(self, file_path, **kwargs):
+        calls.append(kwargs)
+        return original(self, file_path, **kwargs)
+
+    monkeypatch.setattr(ExcelProcessor, "load_workbook", spy)
+    await _get_processor(str(sample_workbook), read_only=True)
+    await _get_processor(str(sample_workbook), read_only=True, data_only=True)
+    _close_cached_workbooks()
+    await _get_processor(str(sample_workbook), read_only=False)
+    assert [c.get("keep_links", True) for c in calls] == [False, False, True]
+
+
+@pytest.mark.asyncio
+async def test_get_processor_never_evicts_unsaved_edits(sample_workbook, tmp_path):
+    """An editable processor with unsaved changes survives cache overflow."""
+    dirty = await _get_processor(str(sample_workbook), read_only=False)
+    dirty.update_cell_value("Sheet1", "B2", 99)
+    for i in range(MAX_CACHED_WORKBOOKS):
+        path = tmp_path / f"copy{i}.xlsx"
+        shutil.copyfile(sample_workbook, path)
+        await _get_processor(str(path), read_only=True)
+    assert dirty.is_workbook_loaded()
+    assert dirty.has_unsaved_changes()
+
+
 # ---------------------------------------------------------------------------
 # run() — server entry point
 # ---------------------------------------------------------------------------
@@ -554,9 +1040,9 @@ class _FakeStdioCtx:
 @pytest.mark.asyncio
 async def test_run_drives_server_run_inside_stdio_context():
     """run() enters stdio_server and awaits server.run exactly once."""
-    with patch("mcp.server.stdio.stdio_server", return_value=_FakeStdioCtx()), \
+    with patch("xlsx_reader.server.stdio_server", return_value=_FakeStdioCtx()), \
          patch("xlsx_reader.server.server.run", new=AsyncMock()) as mock_run, \
-         patch.object(excel_processor, "close_workbook") as cleanup:
+         patch("xlsx_reader.server._close_cached_workbooks") as cleanup:
         await run()
     mock_run.assert_awaited_once()
     cleanup.assert_called_once()
@@ -565,11 +1051,11 @@ async def test_run_drives_server_run_inside_stdio_context():
 @pytest.mark.asyncio
 async def test_run_reraises_unexpected_exception_and_still_cleans_up():
     """run() re-raises non-cleanup exceptions but still closes the workbook."""
-    with patch("mcp.server.stdio.stdio_server", return_value=_FakeStdioCtx()), \
+    with patch("xlsx_reader.server.stdio_server", return_value=_FakeStdioCtx()), \
          patch(
              "xlsx_reader.server.server.run",
              new=AsyncMock(side_effect=RuntimeError("network-down")),
-         ), patch.object(excel_processor, "close_workbook") as cleanup:
+         ), patch("xlsx_reader.server._close_cached_workbooks") as cleanup:
         with pytest.raises(RuntimeError, match="network-down"):
             await run()
     cleanup.assert_called_once()
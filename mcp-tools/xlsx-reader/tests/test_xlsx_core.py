@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -15,25 +16,44 @@ from xlsx_reader.processors.workbook import ExcelProcessor
 from xlsx_reader.utils import validation as v
 
 
+def _build_sample_workbook() -> bytes:
+    # write_only streams rows out without building Cell objects.
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Sales")
+    ws.append(["Product", "Qty", "Price", "Total"])
+    ws.append(["Widget", 2, 3, "=B2*C2"])
+
+    wb.create_sheet("Summary")
+
+    buf = io.BytesIO()
+    wb.save(buf)
+    wb.close()
+    return buf.getvalue()
+
+
+# Built once per test session; each test gets its own copy on disk.
+_SAMPLE_XLSX_BYTES = _build_sample_workbook()
+
+
 def _create_sample_workbook(path: Path) -> None:
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Sales"
+    path.write_bytes(_SAMPLE_XLSX_BYTES)
 
-    ws["A1"].value = "Product"
-    ws["B1"].value = "Qty"
-    ws["C1"].value = "Price"
-    ws["D1"].value = "Total"
 
-    ws["A2"].value = "Widget"
-    ws["B2"].value = 2
-    ws["C2"].value = 3
-    ws["D2"].value = "=B2*C2"
+@pytest.fixture(scope="module")
+def shared_sample_xlsx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One sample file for tests that never write it back to disk."""
+    path = tmp_path_factory.mktemp("shared") / "book.xlsx"
+    _create_sample_workbook(path)
+    return path
 
-    wb.create_sheet("Summary")
 
-    wb.save(path)
-    wb.close()
+@pytest.fixture
+def sample_processor(shared_sample_xlsx: Path):
+    """Editable processor over the shared sample; changes stay in memory."""
+    processor = ExcelProcessor()
+    processor.load_workbook(str(shared_sample_xlsx), read_only=False)
+    yield processor
+    processor.close_workbook()
 
 
 def test_validation_helpers_cover_common_paths(tmp_path: Path):
@@ -83,7 +103,7 @@ def test_safety_file_ops(tmp_path: Path):
             raise RuntimeError("boom")
 
 
-def test_excel_processor_and_exporter_and_charts(tmp_path: Path):
+def test_excel_processor_edit_and_save(tmp_path: Path):
     xlsx_path = tmp_path / "book.xlsx"
     _create_sample_workbook(xlsx_path)
 
@@ -113,10 +133,30 @@ def test_excel_processor_and_exporter_and_charts(tmp_path: Path):
     save = processor.save_workbook()
     assert Path(save["saved_to"]).exists()
 
+    processor.close_workbook()
+
+    # The save must carry the edits back to disk.
+    reloaded = processor.load_workbook(str(xlsx_path), read_only=True)
+    assert reloaded["sheet_names"] == ["Sales", "Summary"]
+    rows = list(processor.iter_rows_values("Sales", "A1:E3"))
+    assert rows[0][4] == "Status"
+    assert rows[2][:2] == ("X", 1)
+    processor.close_workbook()
+
+
+def test_data_exporter_on_sample(shared_sample_xlsx: Path):
+    processor = ExcelProcessor()
+    processor.load_workbook(str(shared_sample_xlsx), read_only=True)
     exporter = DataExporter(processor)
 
     csv = exporter.export_worksheet_to_csv("Sales")
-    assert "csv_data" in csv
+    assert csv["csv_data"].splitlines() == [
+        "Product,Qty,Price,Total",
+        "Widget,2,3,=B2*C2",
+    ]
+    assert exporter.export_worksheet_to_csv("Sales", include_headers=False)[
+        "rows_exported"
+    ] == 1
 
     js = exporter.export_workbook_to_json(include_formulas=True, include_formatting=True)
     assert "json_data" in js
@@ -127,8 +167,11 @@ def test_excel_processor_and_exporter_and_charts(tmp_path: Path):
     stats = exporter.get_summary_statistics("Sales")
     assert stats["total_rows"] >= 1
 
-    # Charts: create then extract/modify/delete.
-    chart_proc = ChartProcessor(processor._workbook)
+    processor.close_workbook()
+
+
+def test_chart_processor_round_trip(sample_processor: ExcelProcessor):
+    chart_proc = ChartProcessor(sample_processor._workbook)
     created = chart_proc.create_chart("Sales", "column", "Sales!A1:D2", title="T")
     assert created["created"] is True
 
@@ -142,16 +185,14 @@ def test_excel_processor_and_exporter_and_charts(tmp_path: Path):
     deleted = chart_proc.delete_chart("Sales", 0)
     assert deleted["deleted"] is True
 
-    processor.close_workbook()
-
 
-@dataclass
+@dataclass(slots=True)
 class _FakeField:
     x: int = 0
     name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakePivotStyle:
     name: str = "PivotStyle"
     showRowHeaders: bool = True
@@ -160,7 +201,7 @@ class _FakePivotStyle:
     showColStripes: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakePivot:
     name: str = "PT1"
     pivotFields: list[object] | None = None
@@ -171,14 +212,8 @@ class _FakePivot:
     pivotTableStyleInfo: object | None = None
 
 
-def test_pivot_table_processor_with_fake_pivot(tmp_path: Path):
-    xlsx_path = tmp_path / "book.xlsx"
-    _create_sample_workbook(xlsx_path)
-
-    processor = ExcelProcessor()
-    processor.load_workbook(str(xlsx_path), read_only=False)
-
-    sheet = processor._workbook["Sales"]
+def test_pivot_table_processor_with_fake_pivot(sample_processor: ExcelProcessor):
+    sheet = sample_processor._workbook["Sales"]
 
     fake = _FakePivot(
         pivotFields=[_FakeField(name="F1")],
@@ -192,7 +227,7 @@ def test_pivot_table_processor_with_fake_pivot(tmp_path: Path):
     # Inject into openpyxl worksheet.
     sheet._pivots = [fake]  # type: ignore[attr-defined]
 
-    piv = PivotTableProcessor(processor._workbook)
+    piv = PivotTableProcessor(sample_processor._workbook)
 
     extracted = piv.extract_pivot_tables_from_sheet("Sales")
     assert len(extracted) == 1
@@ -209,5 +244,3 @@ def test_pivot_table_processor_with_fake_pivot(tmp_path: Path):
 
     deleted = piv.delete_pivot_table("Sales", 0)
     assert deleted["deleted"] in (True, False)
-
-    processor.close_workbook()